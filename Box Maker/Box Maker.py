@@ -1,4 +1,5 @@
 """This file acts as the main module for this script."""
+import math
 import traceback
 import adsk.core
 import adsk.fusion
@@ -14,7 +15,6 @@ def run(context):
         if not design:
             ui.messageBox("Open a Fusion design first.")
             return
-        um = design.unitsManager
         root = design.rootComponent
 
         # ---------- Parameter names & defaults (mm) ----------
@@ -31,16 +31,17 @@ def run(context):
         }
 
         def mm_to_internal(val_mm: float) -> float:
-            # Fusion uses internal cm—convert reliably
-            return um.evaluateExpression(f"{val_mm} mm", "cm")
+            # Fusion uses internal cm; 1 mm is a fixed 0.1 cm, no need to parse an expression
+            return val_mm * 0.1
 
         def get_or_create_len(names, default_mm, comment):
             for n in names:
                 p = design.userParameters.itemByName(n)
                 if p: return p.value, n
             n = names[0]
+            # createByReal takes internal cm; the "mm" units arg still sets the display unit
             p = design.userParameters.add(
-                n, adsk.core.ValueInput.createByString(f"{default_mm} mm"), "mm", comment
+                n, adsk.core.ValueInput.createByReal(mm_to_internal(default_mm)), "mm", comment
             )
             return p.value, n
 
@@ -53,76 +54,95 @@ def run(context):
         TAB_W = mm_to_internal(DEFAULTS_MM["TabWidth"])
         GAP   = mm_to_internal(DEFAULTS_MM["Gap"])
 
-        # ---------- New sketch ----------
-        sk = root.sketches.add(root.xYConstructionPlane)
-        sk.name = "Tabbed Box (T net)"
+        # ---------- One sketch per panel ----------
+        # Profile discovery grows much faster than linearly with the curve count of a
+        # sketch, so each panel (and its finger edges) lives in its own sketch.
+        def panel_sketch(name):
+            sk = root.sketches.add(root.xYConstructionPlane)
+            sk.name = f"Tabbed Box ({name})"
+            # Every added line would otherwise re-solve the sketch and re-find profiles
+            sk.isComputeDeferred = True
+            sk.areProfilesShown = False
+            return sk
 
         def pt(x, y): return adsk.core.Point3D.create(x, y, 0)
 
+        # Single entry point for connected line runs; returns the lines in drawing order.
+        # Each line starts on the previous line's end sketch point, so the run is one chain.
+        def add_polyline(sk, pts, closed=False):
+            add_line = sk.sketchCurves.sketchLines.addByTwoPoints  # resolve the attribute chain once
+            lines = []
+            start = pts[0]
+            for p in pts[1:]:
+                line = add_line(start, p)
+                lines.append(line)
+                start = line.endSketchPoint
+            if closed:
+                lines.append(add_line(start, lines[0].startSketchPoint))
+            return lines
+
         # Panel with real edges (not construction)
-        # returns dict with points and the line objects in order: bottom, right, top, left
-        def panel_rect(x0, y0, w, h):
-            p0 = pt(x0,     y0)      # BL
-            p1 = pt(x0 + w, y0)      # BR
-            p2 = pt(x0 + w, y0 + h)  # TR
-            p3 = pt(x0,     y0 + h)  # TL
-            lines = [
-                sk.sketchCurves.sketchLines.addByTwoPoints(p0, p1),  # bottom
-                sk.sketchCurves.sketchLines.addByTwoPoints(p1, p2),  # right
-                sk.sketchCurves.sketchLines.addByTwoPoints(p2, p3),  # top
-                sk.sketchCurves.sketchLines.addByTwoPoints(p3, p0),  # left
-            ]
-            return dict(pts=[p0,p1,p2,p3], lines=lines)
+        # returns dict with its sketch, corner points, and the edges (start, end) and line
+        # objects in order: bottom, right, top, left (counter-clockwise)
+        def panel_rect(sk, x0, y0, w, h):
+            pts = [(x0, y0), (x0 + w, y0), (x0 + w, y0 + h), (x0, y0 + h)]  # BL, BR, TR, TL
+            edges = [(pts[i], pts[(i + 1) % 4]) for i in range(4)]
+
+            # one call for all four sides; the returned line order isn't documented,
+            # so sort the lines into bottom, right, top, left by their midpoints
+            rect = sk.sketchCurves.sketchLines.addTwoPointRectangle(pt(x0, y0), pt(x0 + w, y0 + h))
+            lines = [None] * 4
+            for line in rect:
+                a = line.startSketchPoint.geometry
+                b = line.endSketchPoint.geometry
+                if abs(a.y - b.y) < abs(a.x - b.x):
+                    lines[0 if (a.y + b.y) * 0.5 < y0 + h * 0.5 else 2] = line
+                else:
+                    lines[1 if (a.x + b.x) * 0.5 > x0 + w * 0.5 else 3] = line
+            return dict(sketch=sk, pts=pts, edges=edges, lines=lines)
 
         # Rectangular finger path that REPLACES a straight edge:
         # we set the straight edge to construction, then draw the fingered outline over it.
-        def finger_edge(start, end, out_vec: adsk.core.Vector3D, male=True, inner_fit=False):
-            dir_vec = adsk.core.Vector3D.create(end.x - start.x, end.y - start.y, 0)
-            Ledge = dir_vec.length
+        # start/end/out are plain floats so no transient Vector3D/Point3D is needed for the math
+        def finger_edge(sk, sx, sy, ex, ey, ox, oy, male=True, inner_fit=False):
+            Ledge = math.hypot(ex - sx, ey - sy)
             if Ledge <= 1e-7: return
-            dir_vec.normalize()
-            out = adsk.core.Vector3D.create(out_vec.x, out_vec.y, 0); out.normalize()
+            dx, dy = (ex - sx) / Ledge, (ey - sy) / Ledge
+            if abs(ox) + abs(oy) != 1:  # callers pass unit axis vectors; only normalize anything else
+                olen = math.hypot(ox, oy)
+                ox, oy = ox / olen, oy / olen
 
             usable = max(1e-7, Ledge - (T if inner_fit else 0.0))
-            n = max(1, int(round(usable / TAB_W)))
-            if n % 2 == 0: n += 1
-            pitch = usable / n
-            half = pitch * 0.5
-
-            cur = adsk.core.Point3D.create(start.x, start.y, 0)
-            for i in range(n):
-                # first half along base
-                s1 = adsk.core.Point3D.create(cur.x + dir_vec.x*half, cur.y + dir_vec.y*half, 0)
-                sk.sketchCurves.sketchLines.addByTwoPoints(cur, s1)
-
-                is_tab = ((i % 2) == 0) == male
-                width_bias = (K if is_tab else -K)  # press-fit: tabs wider, slots narrower
-
-                # out/in by T
-                bump = adsk.core.Point3D.create(
-                    s1.x + out.x*(T if is_tab else -T),
-                    s1.y + out.y*(T if is_tab else -T), 0
-                )
-                sk.sketchCurves.sketchLines.addByTwoPoints(s1, bump)
-
-                # second half + bias
-                s2 = adsk.core.Point3D.create(
-                    bump.x + dir_vec.x*(half + width_bias),
-                    bump.y + dir_vec.y*(half + width_bias), 0
-                )
-                sk.sketchCurves.sketchLines.addByTwoPoints(bump, s2)
-
-                # return to baseline
-                back = adsk.core.Point3D.create(
-                    s2.x - out.x*(T if is_tab else -T),
-                    s2.y - out.y*(T if is_tab else -T), 0
-                )
-                sk.sketchCurves.sketchLines.addByTwoPoints(s2, back)
-                cur = back
+            # too short for even half a tab: keep the edge straight rather than add tiny fingers.
+            # Decided on the seam length itself, not usable, so both mating edges agree.
+            if Ledge < TAB_W * 0.5:
+                offsets = [(usable, 0.0)]
+            else:
+                n = max(1, int(round(usable / TAB_W)))
+                if n % 2 == 0: n += 1
+                pitch = usable / n
+                half = pitch * 0.5
+
+                # Lay the whole zig-zag out as plain (along, out) offsets first, so the
+                # loop is pure float math and only the final points touch the API
+                offsets = []
+                t = 0.0
+                for i in range(n):
+                    is_tab = ((i % 2) == 0) == male
+                    width_bias = (K if is_tab else -K)  # press-fit: tabs wider, slots narrower
+                    depth = (T if is_tab else -T)
+                    t1 = t + half                       # first half along base
+                    t2 = t1 + half + width_bias         # second half + bias
+                    offsets += [(t1, 0.0), (t1, depth), (t2, depth), (t2, 0.0)]  # out, across, back
+                    t = t2
+
+            pts = [pt(sx, sy)]
+            pts += [pt(sx + dx*a + ox*d, sy + dy*a + oy*d) for a, d in offsets]
+            cur = add_polyline(sk, pts)[-1].endSketchPoint
 
             # close to the original end if inner-fit shortened the run (construction so it doesn't block profiles)
             if inner_fit:
-                tail = sk.sketchCurves.sketchLines.addByTwoPoints(cur, end)
+                tail = sk.sketchCurves.sketchLines.addByTwoPoints(cur, pt(ex, ey))
                 tail.isConstruction = True
 
         # coords (T layout)
@@ -134,12 +154,17 @@ def run(context):
         yTop   = yFront + H + GAP
         yBottom= 0
 
-        front  = panel_rect(xFront,  yFront,  L, H)
-        leftp  = panel_rect(xLeft,   yFront,  W, H)
-        rightp = panel_rect(xRight,  yFront,  W, H)
-        back   = panel_rect(xBack,   yFront,  L, H)
-        top    = panel_rect(xFront,  yTop,    L, H)
-        bottom = panel_rect(xFront,  yBottom, L, H)
+        # panel table: name, x0, y0, w, h
+        PANEL_LAYOUT = (
+            ("Front",  xFront,  yFront,  L, H),
+            ("Left",   xLeft,   yFront,  W, H),
+            ("Right",  xRight,  yFront,  W, H),
+            ("Back",   xBack,   yFront,  L, H),
+            ("Top",    xFront,  yTop,    L, H),
+            ("Bottom", xFront,  yBottom, L, H),
+        )
+        panels = [panel_rect(panel_sketch(name), x0, y0, w, h) for name, x0, y0, w, h in PANEL_LAYOUT]
+        front, leftp, rightp, back, top, bottom = panels
 
         # vectors
         up    = adsk.core.Vector3D.create(0,  1, 0)
@@ -149,67 +174,94 @@ def run(context):
 
         # helper to replace a panel edge with fingers
         # edge index: 0=bottom, 1=right, 2=top, 3=left
+        # (the drawn line's direction may differ, so the path follows the panel's own edge order)
         def replace_edge(panel, edge_index, out_vec, male, inner_fit):
-            line = panel["lines"][edge_index]
-            pstart = line.startSketchPoint.geometry
-            pend   = line.endSketchPoint.geometry
-            line.isConstruction = True  # keep it as reference, but don't block profile
-            finger_edge(pstart, pend, out_vec, male=male, inner_fit=inner_fit)
+            (sx, sy), (ex, ey) = panel["edges"][edge_index]
+            panel["lines"][edge_index].isConstruction = True  # keep it as reference, but don't block profile
+            finger_edge(panel["sketch"], sx, sy, ex, ey, out_vec.x, out_vec.y,
+                        male=male, inner_fit=inner_fit)
+
+        # Seams as (panel, edge index, outward vector, male, inner fit)
+        SEAMS = (
+            # Ring seams (Front-Right-Back-Left)
+            (front,  1, vecR, True,  False),  # Front right M/o
+            (rightp, 3, vecL, False, True),  # Right left F/i
 
-        # Ring seams (Front-Right-Back-Left)
-        replace_edge(front,  1, vecR, True,  False)  # Front right M/o
-        replace_edge(rightp, 3, vecL, False, True)   # Right left F/i
+            (rightp, 1, vecR, True,  False),  # Right right M/o
+            (back,   3, vecL, False, True),  # Back left F/i
 
-        replace_edge(rightp, 1, vecR, True,  False)  # Right right M/o
-        replace_edge(back,   3, vecL, False, True)   # Back left F/i
+            (back,   1, vecR, True,  False),  # Back right M/o
+            (leftp,  3, vecL, False, True),  # Left left F/i
 
-        replace_edge(back,   1, vecR, True,  False)  # Back right M/o
-        replace_edge(leftp,  3, vecL, False, True)   # Left left F/i
+            (leftp,  1, vecR, True,  False),  # Left right M/o
+            (front,  3, vecL, False, True),  # Front left F/i
 
-        replace_edge(leftp,  1, vecR, True,  False)  # Left right M/o
-        replace_edge(front,  3, vecL, False, True)   # Front left F/i
+            # Top (M/i) with side mates (F/o)
+            (top,   0, up,    True,  True),  # Top bottom -> Front top
+            (front, 2, down,  False, False),
 
-        # Top (M/i) with side mates (F/o)
-        replace_edge(top,   0, up,    True,  True)   # Top bottom -> Front top
-        replace_edge(front, 2, down,  False, False)
+            (top,   1, vecR,  True,  True),  # Top right -> Right top
+            (rightp,2, up,    False, False),
 
-        replace_edge(top,   1, vecR,  True,  True)   # Top right -> Right top
-        replace_edge(rightp,2, up,    False, False)
+            (top,   2, up,    True,  True),  # Top top -> Back top
+            (back,  0, down,  False, False),
 
-        replace_edge(top,   2, up,    True,  True)   # Top top -> Back top
-        replace_edge(back,  0, down,  False, False)
+            (top,   3, vecL,  True,  True),  # Top left -> Left top
+            (leftp, 2, up,    False, False),
 
-        replace_edge(top,   3, vecL,  True,  True)   # Top left -> Left top
-        replace_edge(leftp, 2, up,    False, False)
+            # Bottom (M/i) with side mates (F/o)
+            (bottom,2, up,    True,  True),  # Bottom top -> Front bottom
+            (front, 0, up,    False, False),
 
-        # Bottom (M/i) with side mates (F/o)
-        replace_edge(bottom,2, up,    True,  True)   # Bottom top -> Front bottom
-        replace_edge(front, 0, up,    False, False)
+            (bottom,1, vecR,  True,  True),  # Bottom right -> Right bottom
+            (rightp,0, up,    False, False),
 
-        replace_edge(bottom,1, vecR,  True,  True)   # Bottom right -> Right bottom
-        replace_edge(rightp,0, up,    False, False)
+            (bottom,0, down,  True,  True),  # Bottom bottom -> Back bottom
+            (back,  2, up,    False, False),
 
-        replace_edge(bottom,0, down,  True,  True)   # Bottom bottom -> Back bottom
-        replace_edge(back,  2, up,    False, False)
+            (bottom,3, vecL,  True,  True),  # Bottom left -> Left bottom
+            (leftp, 0, up,    False, False),
+        )
+        for panel, edge_index, out_vec, male, inner_fit in SEAMS:
+            replace_edge(panel, edge_index, out_vec, male, inner_fit)
 
-        replace_edge(bottom,3, vecL,  True,  True)   # Bottom left -> Left bottom
-        replace_edge(leftp, 0, up,    False, False)
+        for panel in panels:
+            panel["sketch"].areProfilesShown = True
+            panel["sketch"].isComputeDeferred = False
 
         # ---------- turn profiles into solid test parts ----------
-        profs = [p for p in sk.profiles]  # snapshot; profiles collection is dynamic
-        if not profs:
-            ui.messageBox("No profiles found—check for tiny gaps.")
+        # one extrude per panel sketch: panels in a single new-body feature would fuse
+        # wherever a tab tip lands on the neighbouring panel's outline
+        panel_profiles = []
+        for panel in panels:
+            profs = adsk.core.ObjectCollection.create()  # snapshot; profiles collections are dynamic
+            for pr in panel["sketch"].profiles:
+                profs.add(pr)
+            panel_profiles.append(profs)
+        # a panel that didn't close is reported by name; the others are still built
+        failed = [name for (name, *_), profs in zip(PANEL_LAYOUT, panel_profiles) if profs.count == 0]
+        if len(failed) == len(PANEL_LAYOUT):
+            ui.messageBox("No profiles found in any panel—check for tiny gaps. Nothing was built.")
             return
 
         extrudes = root.features.extrudeFeatures
         dist = adsk.core.ValueInput.createByReal(T)  # internal cm distance
-        for pr in profs:
-            ext = extrudes.addSimple(pr, dist, adsk.fusion.FeatureOperations.NewBodyFeatureOperation)
-            # Name bodies for clarity
-            try:
-                ext.bodies.item(0).name = "Panel"
-            except:
-                pass
+        for (name, *_), profs in zip(PANEL_LAYOUT, panel_profiles):
+            if profs.count == 0:
+                continue
+            ext_input = extrudes.createInput(profs, adsk.fusion.FeatureOperations.NewBodyFeatureOperation)
+            ext_input.setDistanceExtent(False, dist)
+            ext = extrudes.add(ext_input)
+            # Name bodies after their panel for clarity
+            for i in range(ext.bodies.count):
+                ext.bodies.item(i).name = name if i == 0 else f"{name} {i + 1}"
+
+        if failed:
+            ui.messageBox(
+                f"No profiles found for: {', '.join(failed)}—check for tiny gaps.\n"
+                "The other panels were extruded."
+            )
+            return
 
         ui.messageBox(
             "Tabbed T-pattern created and extruded.\n"
@@ -1,152 +1,264 @@
 import adsk.core, adsk.fusion, traceback, math
 
+# Set to True to log a per-wrench engraving summary to the Text Commands window
+DEBUG = False
+
 
 def mm(val):
     """Convert mm to cm (Fusion 360 API internal units)."""
     return val / 10.0
 
 
-def create_wrench_profile(sketch, origin_x, mouth_width, jaw_depth, jaw_thickness, handle_height):
+def add_polyline(sketch, points, closed=False):
+    """
+    Draw connected line segments through the given points.
+    Each segment starts on the previous segment's end sketch point, so the run is
+    one connected chain (and a closed run one loop) rather than coincident copies.
+    Returns the created sketch lines in drawing order.
+    """
+    add_line = sketch.sketchCurves.sketchLines.addByTwoPoints
+    created = []
+    start = points[0]
+    for point in points[1:]:
+        line = add_line(start, point)
+        created.append(line)
+        start = line.endSketchPoint
+    if closed:
+        created.append(add_line(start, created[0].startSketchPoint))
+    return created
+
+
+def create_wrench_profile(sketch, origin_y, mouth_width, jaw_depth, jaw_thickness, handle_height):
     """
     Draw a closed wrench profile on the given sketch.
-    Returns the handle center position (x, y) in mm.
+    The wrench lies along X (mouth at x=0, handle toward +X) so a label at angle 0 reads along the handle.
+    Returns the handle center position (x, y) in mm, or None if a dimension is not positive.
     """
-    lines = sketch.sketchCurves.sketchLines
+    # A zero or negative dimension cannot close a profile, so draw nothing for it
+    if mouth_width <= 0 or jaw_depth <= 0 or jaw_thickness <= 0 or handle_height <= 0:
+        return None
 
     # Convert to internal units
-    x0 = mm(origin_x)
+    y0 = mm(origin_y)
     mw = mm(mouth_width)
     jd = mm(jaw_depth)
     jt = mm(jaw_thickness)
     hh = mm(handle_height)
 
-    # Define profile points (clockwise from bottom-left outer)
+    # Define profile points (counter-clockwise from mouth-bottom outer)
     points = [
-        adsk.core.Point3D.create(x0 - jt, 0, 0),           # bottom-left outer
-        adsk.core.Point3D.create(x0 - jt, jd + hh, 0),     # top-left outer
-        adsk.core.Point3D.create(x0 + mw + jt, jd + hh, 0),# top-right outer
-        adsk.core.Point3D.create(x0 + mw + jt, 0, 0),      # bottom-right outer
-        adsk.core.Point3D.create(x0 + mw, 0, 0),           # bottom-right inner
-        adsk.core.Point3D.create(x0 + mw, jd, 0),          # top-right inner
-        adsk.core.Point3D.create(x0, jd, 0),               # top-left inner
-        adsk.core.Point3D.create(x0, 0, 0),                # bottom-left inner
+        adsk.core.Point3D.create(0, y0 - jt, 0),           # mouth-bottom outer
+        adsk.core.Point3D.create(jd + hh, y0 - jt, 0),     # handle-bottom outer
+        adsk.core.Point3D.create(jd + hh, y0 + mw + jt, 0),# handle-top outer
+        adsk.core.Point3D.create(0, y0 + mw + jt, 0),      # mouth-top outer
+        adsk.core.Point3D.create(0, y0 + mw, 0),           # mouth-top inner
+        adsk.core.Point3D.create(jd, y0 + mw, 0),          # back-top inner
+        adsk.core.Point3D.create(jd, y0, 0),               # back-bottom inner
+        adsk.core.Point3D.create(0, y0, 0),                # mouth-bottom inner
     ]
 
     # Draw closed profile
-    for i in range(len(points)):
-        lines.addByTwoPoints(points[i], points[(i + 1) % len(points)])
+    add_polyline(sketch, points, closed=True)
 
     # Return handle center in mm
-    handle_center_x = origin_x + mouth_width / 2.0
-    handle_center_y = jaw_depth + handle_height / 2.0
+    handle_center_x = jaw_depth + handle_height / 2.0
+    handle_center_y = origin_y + mouth_width / 2.0
     return handle_center_x, handle_center_y
 
 
 def extrude_profile(extrudes, profile, depth_mm, operation):
-    """Extrude a profile and return the resulting body."""
+    """Extrude a profile (or an ObjectCollection of profiles) and return the ExtrudeFeature."""
     ext_input = extrudes.createInput(profile, operation)
     ext_input.setDistanceExtent(False, adsk.core.ValueInput.createByReal(mm(depth_mm)))
-    result = extrudes.add(ext_input)
-    return result.bodies.item(0) if result.bodies.count > 0 else None
+    return extrudes.add(ext_input)
 
 
-def create_text_profiles(sketch, text, position_x, position_y, height_mm):
+def create_label_text(sketch, text, position, angle, height_mm):
     """
-    Create text on a sketch, explode it, and return the profiles.
-    Text is rotated 90 degrees and centered horizontally.
+    Create text on a sketch and return the SketchText.
+    position is in sketch space; text runs at angle (radians) and is centered horizontally.
     """
     texts = sketch.sketchTexts
-    position = adsk.core.Point3D.create(mm(position_x), mm(position_y), 0)
 
     text_input = texts.createInput(text, mm(height_mm), position)
     text_input.horizontalAlignment = adsk.core.HorizontalAlignments.CenterHorizontalAlignment
-    text_input.angle = math.pi / 2
-
-    sketch_text = texts.add(text_input)
-    sketch_text.explode()
-
-    return sketch.profiles
+    text_input.angle = angle
 
+    return texts.add(text_input)
 
-def engrave_profiles(extrudes, profiles, depth_mm):
-    """Cut profiles into existing bodies. Returns (success_count, fail_count)."""
-    success = 0
-    fail = 0
 
-    for i in range(profiles.count):
-        try:
-            profile = profiles.item(i)
-            ext_input = extrudes.createInput(profile, adsk.fusion.FeatureOperations.CutFeatureOperation)
-            distance = adsk.fusion.DistanceExtentDefinition.create(
-                adsk.core.ValueInput.createByReal(mm(depth_mm))
-            )
-            ext_input.setOneSideExtent(distance, adsk.fusion.ExtentDirections.NegativeExtentDirection)
-            extrudes.add(ext_input)
-            success += 1
-        except:
-            fail += 1
-
-    return success, fail
+def engrave_text(features, sketch_text, face, depth, text_collection):
+    """
+    Engrave sketch text into a face with a single emboss feature.
+    The text is used directly, so it never has to be exploded into glyph profiles.
+    depth is a ValueInput and text_collection an ObjectCollection, so both can be shared by every engrave.
+    Returns None on success, or the RuntimeError Fusion raised.
+    """
+    text_collection.clear()
+    text_collection.add(sketch_text)
 
+    try:
+        emboss_input = features.embossFeatures.createInput(
+            text_collection, face, adsk.fusion.EmbossFeatureTypes.EngraveEmbossFeatureType
+        )
+        emboss_input.depth = depth
+        features.embossFeatures.add(emboss_input)
+    except RuntimeError as e:
+        return e
 
-def create_offset_plane(root_comp, z_offset_mm):
-    """Create a construction plane offset from XY plane."""
-    planes = root_comp.constructionPlanes
-    plane_input = planes.createInput()
-    offset = adsk.core.ValueInput.createByReal(mm(z_offset_mm))
-    plane_input.setByOffset(root_comp.xYConstructionPlane, offset)
-    return planes.add(plane_input)
+    return None
 
 
-def create_labeled_wrench(root_comp, extrudes, label, origin_x, config):
+def create_wrench_bodies(root_comp, extrudes, wrenches, config):
     """
-    Create a single wrench body with engraved label.
-    Returns debug info string.
+    Draw every wrench outline on one sketch and extrude them all as a single feature.
+    wrenches is a list of (label, origin_y, mouth_width), ordered bottom to top.
+    Wrenches with a degenerate size are skipped.
+    Returns a list of (label, body, top_face, handle_x, handle_y).
+    Raises RuntimeError if the outlines don't give one profile, body and top face per wrench.
     """
-    # Create wrench body sketch on XY plane
     body_sketch = root_comp.sketches.add(root_comp.xYConstructionPlane)
-
-    handle_x, handle_y = create_wrench_profile(
-        body_sketch,
-        origin_x,
-        config['mouth_width'],
-        config['jaw_depth'],
-        config['jaw_thickness'],
-        config['handle_height']
-    )
-
-    # Extrude wrench body
-    if body_sketch.profiles.count == 0:
-        return f"{label}: No profile created"
-
-    body = extrude_profile(
+    # Solve once after every outline is drawn instead of after every line
+    body_sketch.isComputeDeferred = True
+
+    drawn = []
+    for label, origin_y, mouth_width in wrenches:
+        handle = create_wrench_profile(
+            body_sketch,
+            origin_y,
+            mouth_width,
+            config['jaw_depth'],
+            config['jaw_thickness'],
+            config['handle_height']
+        )
+        if handle is not None:
+            drawn.append((label, handle))
+
+    body_sketch.isComputeDeferred = False
+
+    if not drawn:
+        raise RuntimeError('No wrench outlines could be drawn; check the configured dimensions.')
+    if body_sketch.profiles.count != len(drawn):
+        raise RuntimeError('Expected {} wrench profiles but the sketch has {}.'.format(
+            len(drawn), body_sketch.profiles.count))
+
+    profiles = adsk.core.ObjectCollection.create()
+    for profile in body_sketch.profiles:
+        profiles.add(profile)
+
+    feature = extrude_profile(
         extrudes,
-        body_sketch.profiles.item(0),
+        profiles,
         config['extrude_depth'],
         adsk.fusion.FeatureOperations.NewBodyFeatureOperation
     )
 
-    if body is None:
-        return f"{label}: Extrude failed"
-
-    body.name = label
+    if feature.bodies.count != len(drawn) or feature.endFaces.count != len(drawn):
+        raise RuntimeError('Expected {} wrench bodies but the extrude made {} bodies and {} top faces.'.format(
+            len(drawn), feature.bodies.count, feature.endFaces.count))
+
+    # A multi-profile extrude does not keep profile order; the wrenches run bottom to top.
+    # The extrude's end caps are the wrench tops, so no face search is needed.
+    bodies = sorted(feature.bodies, key=lambda body: body.boundingBox.minPoint.y)
+    top_faces = sorted(feature.endFaces, key=lambda face: face.boundingBox.minPoint.y)
+    return [
+        (label, body, top_face, handle_x, handle_y)
+        for (label, (handle_x, handle_y)), body, top_face in zip(drawn, bodies, top_faces)
+    ]
 
-    # Create text sketch on a plane at the top of the body
-    text_plane = create_offset_plane(root_comp, config['extrude_depth'])
-    text_sketch = root_comp.sketches.add(text_plane)
 
-    # Create and engrave text
-    profiles = create_text_profiles(
+def label_wrench(root_comp, body, top_face, label, handle_x, handle_y, config, engrave_depth, text_collection, engrave=True):
+    """
+    Name a wrench body and engrave its label on the handle.
+    Returns None on success, or the error that stopped the engrave.
+    """
+    body.name = label
+    if not engrave:
+        return None
+
+    # Sketch the text straight on the top face instead of on an extra construction plane.
+    # A face sketch has its own axes, so map the handle center and the model X direction
+    # (the way the handle and its label run) into sketch space.
+    text_sketch = root_comp.sketches.add(top_face)
+    top_z = mm(config['extrude_depth'])
+    # The sketch lives in the root component, so inverting its transform once maps
+    # both points without a modelToSketchSpace round trip for each.
+    to_sketch = text_sketch.transform
+    to_sketch.invert()
+    position = adsk.core.Point3D.create(mm(handle_x), mm(handle_y), top_z)
+    position.transformBy(to_sketch)
+    along = adsk.core.Point3D.create(mm(handle_x) + 1.0, mm(handle_y), top_z)
+    along.transformBy(to_sketch)
+
+    # Create and engrave text on the top face of the body
+    sketch_text = create_label_text(
         text_sketch,
         label,
-        handle_x,
-        handle_y,
+        position,
+        math.atan2(along.y - position.y, along.x - position.x),
         config['text_height']
     )
 
-    success, fail = engrave_profiles(extrudes, profiles, config['emboss_depth'])
+    error = engrave_text(root_comp.features, sketch_text, top_face, engrave_depth, text_collection)
+
+    if DEBUG:
+        adsk.core.Application.get().log(f"{label}: {'engraved' if error is None else f'engrave failed: {error}'}")
+
+    return error
+
+
+def build_wrench_set(root_comp, extrudes, wrenches, config):
+    """
+    Create, name and label every wrench.
+    Returns (last engrave error or None, labels that were not engraved).
+    """
+    # All bodies come from one extrude feature, then each gets its label.
+    # Once the same error message fails two engraves in a row it will fail the rest too,
+    # so the remaining bodies are only named.
+    engrave_depth = adsk.core.ValueInput.createByReal(mm(config['emboss_depth']))
+    text_collection = adsk.core.ObjectCollection.create()
+    last_err = None
+    consecutive_failures = 0
+    unlabeled = []
+    for label, body, top_face, handle_x, handle_y in create_wrench_bodies(root_comp, extrudes, wrenches, config):
+        engrave = consecutive_failures < 2
+        error = label_wrench(
+            root_comp, body, top_face, label, handle_x, handle_y, config, engrave_depth, text_collection, engrave
+        )
+        if not engrave:
+            unlabeled.append(label)
+            continue
+        if error is None:
+            consecutive_failures = 0
+        else:
+            unlabeled.append(label)
+            repeated = last_err is not None and str(error) == str(last_err)
+            consecutive_failures = consecutive_failures + 1 if repeated else 1
+            last_err = error
+
+    return last_err, unlabeled
+
+
+def timeline_position(design):
+    """
+    Return the timeline marker position, or None for a direct-modeling design (it has no timeline).
+    """
+    if design.designType != adsk.fusion.DesignTypes.ParametricDesignType:
+        return None
+    return design.timeline.markerPosition
+
+
+def group_timeline(design, start_index, name):
+    """
+    Collapse the timeline entries added since start_index into one named group.
+    """
+    if start_index is None:
+        return
 
-    return f"{label}: {profiles.count} profiles, {success} engraved, {fail} failed"
+    timeline = design.timeline
+    end_index = timeline.markerPosition - 1
+    if end_index > start_index:
+        timeline.timelineGroups.add(start_index, end_index).name = name
 
 
 def run(context):
@@ -174,16 +286,25 @@ def run(context):
         mouth_size_max = 4.0
         mouth_size_increment = 0.5
 
-        # Generate mouth sizes from range
-        mouth_size = mouth_size_min
-        i = 0
-        while mouth_size <= mouth_size_max + 0.001:  # Small epsilon for float comparison
-            origin_x = i * config['spacing']
-            config['mouth_width'] = mouth_size
-            label = f"{mouth_size:.1f}"
-            create_labeled_wrench(root_comp, extrudes, label, origin_x, config)
-            mouth_size += mouth_size_increment
-            i += 1
+        # Generate mouth sizes from range. The count is fixed up front so float rounding
+        # can't drop the last size, and each size is scaled from its index, not accumulated.
+        size_count = int(round((mouth_size_max - mouth_size_min) / mouth_size_increment)) + 1
+        mouth_sizes = [mouth_size_min + k * mouth_size_increment for k in range(size_count)]
+
+        # Stack the wrenches bottom to top at a fixed pitch
+        wrenches = [(f"{size:.1f}", i * config['spacing'], size) for i, size in enumerate(mouth_sizes)]
+
+        # Build the whole set as one timeline group, even if it stops partway,
+        # so the history shows a single entry instead of one per sketch and feature
+        timeline_start = timeline_position(design)
+        try:
+            last_err, unlabeled = build_wrench_set(root_comp, extrudes, wrenches, config)
+        finally:
+            group_timeline(design, timeline_start, 'FitSizer')
+
+        if last_err is not None:
+            ui.messageBox('These labels were not engraved: {}\n\nLast error:\n{}'.format(
+                ', '.join(unlabeled), last_err))
 
         # ui.messageBox("Done", "Results")
 
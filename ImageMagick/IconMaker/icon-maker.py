@@ -1,11 +1,72 @@
-from wand.image import Image
-from wand.color import Color
+"""
+Makes the PNG icon sizes for a Fusion 360 add-in from one WebP image.
+
+Requires Pillow (pip install Pillow). ImageMagick and Wand are no longer used.
+"""
+from concurrent.futures import ThreadPoolExecutor
 import os
-import tempfile
+
+try:
+    from PIL import Image
+except ImportError as e:
+    raise ImportError(
+        "icon-maker.py needs Pillow to resize the icons; install it with: pip install Pillow") from e
+
+
+def _fitted_size(src, size):
+    """
+    Returns the (width, height) that fits the source inside one icon size.
+    The aspect ratio is kept, matching ImageMagick's "WxH" resize geometry.
+    """
+    width, height = size
+    scale = min(width / src.width, height / src.height)
+    return (max(1, round(src.width * scale)), max(1, round(src.height * scale)))
+
+
+def _halving_chains(sizes):
+    """
+    Groups the sizes, largest first, into chains where each size is half the one before it,
+    e.g. 256 -> 128 -> 64 -> 32 -> 16 and 96 -> 48 -> 24.
+    """
+    chains = []
+    for size in sorted(sizes, reverse=True):
+        for chain in chains:
+            if chain[-1] == (size[0] * 2, size[1] * 2):
+                chain.append(size)
+                break
+        else:
+            chains.append([size])
+    return chains
+
+
+def _resize_chain(src, chain, output_dir):
+    """
+    Resizes and saves one halving chain. Only the first icon is resampled from the source;
+    each later icon is box-filtered from the previous one when it is exactly twice as large,
+    so every step touches a quarter of the pixels of the one before.
+
+    Returns:
+        The saved file paths.
+    """
+    output_paths = []
+    prev = None
+    for size in chain:
+        fitted = _fitted_size(src, size)
+        if prev is not None and prev.size == (fitted[0] * 2, fitted[1] * 2):
+            icon = prev.resize(fitted, Image.BOX)
+        else:
+            icon = src.resize(fitted, Image.LANCZOS)
+
+        output_path = os.path.join(output_dir, f"icon_{size[0]}.png")
+        icon.save(output_path, format='PNG', optimize=False)
+        output_paths.append(output_path)
+        prev = icon
+    return output_paths
+
 
 def convert_webp_to_png_icons(webp_filepath):
     """
-    Converts a WebP file to an intermediate PNG, then to multiple PNG icon files of different sizes,
+    Converts a WebP file to multiple PNG icon files of different sizes,
     saving them in a folder with the same base name as the WebP file.
 
     Args:
@@ -23,42 +84,22 @@ def convert_webp_to_png_icons(webp_filepath):
     output_dir = os.path.join(input_dir, base_name)
     os.makedirs(output_dir, exist_ok=True)
 
-    # Create a temporary file for the intermediate PNG
-    with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp_png:
-        temp_png_path = tmp_png.name
-
-        try:
-            # First, convert WebP to a temporary PNG file
-            with Image(filename=webp_filepath) as img:
-                img.format = 'png'
-                img.background_color = Color('transparent')
-                if not img.alpha_channel:
-                    img.alpha_channel = 'activate'  # Ensure alpha channel
-                img.save(filename=temp_png_path)
-                print(f"Saved temporary PNG: {temp_png_path}")
-
-            # Then, create icons from the temporary PNG
-            with Image(filename=temp_png_path) as img:
-                for width, height in sizes:
-                    with img.clone() as i:
-                        i.transform(resize=f"{width}x{height}")
-
-                        if i.width == 0 or i.height == 0:
-                            print(f"Warning: Image has invalid dimensions after resizing to {width}x{height}. Skipping.")
-                            continue
-
-                        output_path = os.path.join(output_dir, f"icon_{width}.png")
-                        i.save(filename=output_path)
-                        print(f"Saved {output_path}")
-
-        except Exception as e:
-            print(f"An error occurred: {e}")
-
-        finally:
-            # Clean up the temporary PNG file
-            os.remove(temp_png_path)
-            print(f"Deleted temporary file: {temp_png_path}")
+    try:
+        # Decode the WebP once; RGBA keeps (or adds) a transparent alpha channel
+        with Image.open(webp_filepath) as img:
+            src = img.convert('RGBA')
+
+        # Each halving chain is independent, and Pillow releases the GIL while it resamples
+        # and encodes, so the chains are produced in parallel. Empty sizes are skipped.
+        chains = _halving_chains([size for size in sizes if size[0] > 0 and size[1] > 0])
+        with ThreadPoolExecutor(max_workers=max(1, min(8, len(chains)))) as pool:
+            for output_paths in pool.map(lambda chain: _resize_chain(src, chain, output_dir), chains):
+                for output_path in output_paths:
+                    print(f"Saved {output_path}")
+
+    except Exception as e:
+        print(f"An error occurred: {e}")
 
 # Example usage:
 input_webp_file = r"C:\Users\gordon\Downloads\board-icon.webp"  # Replace with the actual path to your WebP file
-convert_webp_to_png_icons(input_webp_file)
\ No newline at end of file
+convert_webp_to_png_icons(input_webp_file)
@@ -1,82 +1,122 @@
-import adsk.core, adsk.fusion, adsk.cam, traceback, os
+import adsk.core, adsk.fusion, traceback, os, logging, types
 
-# Global list to keep event handlers in scope.
-handlers = []
+# Debug tracing; raise the level to DEBUG while developing the add-in.
+log = logging.getLogger(__name__)
+log.setLevel(logging.WARNING)
 
-class LumberSelector:
-    def __init__(self):
-        print("Initializing LumberSelector...")
-        self.app = adsk.core.Application.get()
-        self.ui = self.app.userInterface
-        self.handlers = []
-    
-    def create_command_definition(self):
-        print("Creating command definition...")
-        # Use your script directory to locate the resources folder.
-        # (For now, we're passing an empty string as the icon so we don't run into icon issues.)
-        scriptDir = os.path.dirname(os.path.realpath(__file__))
-        iconPath = os.path.join(scriptDir, 'resources')
-        print(f"Checking icon path: {iconPath}")
-        if not os.path.exists(iconPath):
-            print(f"Resource folder not found at: {iconPath}")
-            # For testing, we ignore the icons by passing an empty string.
-            iconPath = ""
-    
-        try:
-            cmdDefs = self.ui.commandDefinitions
-            # Delete any existing definition.
-            cmdDef = cmdDefs.itemById('lumberDimensionSelector')
-            if cmdDef:
-                cmdDef.deleteMe()
-    
-            cmdDef = cmdDefs.addButtonDefinition(
-                'lumberDimensionSelector',
-                'Lumber Dialog',
-                'Open the lumber dialog',
-                iconPath  # Using empty icon path if resources not set up.
-            )
-            print("Command definition created successfully.")
-            return cmdDef
-        except Exception:
-            self.ui.messageBox('Error in create_command_definition:\n{}'.format(traceback.format_exc()))
-    
-    def add_command_inputs(self, command):
-        print("Adding command inputs...")
-        inputs = command.commandInputs
-        
-        # Radio button for Dimension Type
-        dimInput = inputs.addRadioButtonGroupCommandInput('dimensionType', 'Dimension Type', '')
-        dimInput.listItems.add('Nominal', True)
-        dimInput.listItems.add('Actual', False)
-        
-        # Radio button for Lumber Size
-        sizeInput = inputs.addRadioButtonGroupCommandInput('lumberSize', 'Lumber Size', '')
-        for s in ['2x4', '2x6', '2x8', '2x10', '2x12']:
-            sizeInput.listItems.add(s, s == '2x4')
-        import adsk.core, adsk.fusion, adsk.cam, traceback, os
+# Add-in folder and its icon resources, resolved once at import
+_SCRIPT_DIR = os.path.dirname(os.path.realpath(__file__))
+_ICON_PATH = os.path.join(_SCRIPT_DIR, 'resources')
+
+# Lumber cross-section (thickness, width) in inches. The tables are read-only views.
+NOMINAL_DIMENSIONS = types.MappingProxyType({
+    '2x4': (2.0, 4.0),
+    '2x6': (2.0, 6.0),
+    '2x8': (2.0, 8.0),
+    '2x10': (2.0, 10.0),
+    '2x12': (2.0, 12.0),
+})
+ACTUAL_DIMENSIONS = types.MappingProxyType({
+    '2x4': (1.5, 3.5),
+    '2x6': (1.5, 5.5),
+    '2x8': (1.5, 7.25),
+    '2x10': (1.5, 9.25),
+    '2x12': (1.5, 11.25),
+})
+
+# (dimension type, lumber size) -> (thickness, width) in cm, converted once at import
+LUMBER_DIMS = types.MappingProxyType({
+    (dimensionType, size): (thickness * 2.54, width * 2.54)
+    for dimensionType, table in (('Nominal', NOMINAL_DIMENSIONS), ('Actual', ACTUAL_DIMENSIONS))
+    for size, (thickness, width) in table.items()
+})
+
+# Lumber size radio items as (label, is_default) in dialog order; the first is the default
+_LUMBER_SIZE_ITEMS = tuple((size, i == 0) for i, size in enumerate(NOMINAL_DIMENSIONS))
+
+# Entities the target input accepts: axes and starting points
+_TARGET_FILTERS = ('LinearEdges', 'SketchPoints', 'Vertices')
+
+# Default board length of 96 in (8 ft). Real ValueInputs are in the internal unit (cm).
+# addValueInput only reads it, so one instance serves every dialog.
+_DEFAULT_LENGTH = adsk.core.ValueInput.createByReal(96 * 2.54)
+
+def timeline_position(design):
+    """
+    Return the timeline marker position, or None for a direct-modeling design (it has no timeline).
+    """
+    if design.designType != adsk.fusion.DesignTypes.ParametricDesignType:
+        return None
+    return design.timeline.markerPosition
 
-handlers = []  # Global list for event handlers
+def group_timeline(design, start_index, name):
+    """
+    Collapse the timeline entries added since start_index into one named group.
+    """
+    if start_index is None:
+        return
+
+    timeline = design.timeline
+    end_index = timeline.markerPosition - 1
+    if end_index > start_index:
+        timeline.timelineGroups.add(start_index, end_index).name = name
+
+def body_states(bodies):
+    """
+    Returns the visibility and bounding box of each body, or None once any body has been
+    deleted or undone, so a later execute can tell whether the boards were touched.
+    """
+    states = []
+    for body in bodies:
+        if not body.isValid:
+            return None
+        box = body.boundingBox
+        corners = (box.minPoint.asArray(), box.maxPoint.asArray())
+        states.append((body.isVisible, tuple(round(c, 6) for corner in corners for c in corner)))
+    return states
 
 class LumberSelector:
+    # Resource folder, checked once per session
+    _cached_icon_path = None
+    
     def __init__(self):
-        print("Initializing LumberSelector...")
+        log.debug("Initializing LumberSelector...")
         self.app = adsk.core.Application.get()
         self.ui = self.app.userInterface
-        self.handlers = []
+        # One live handler per event; Fusion does not keep Python handlers alive, so they stay referenced here
+        self.handlers = {}
+        # Every dialog shares this execute handler instead of getting a new one
+        self._execute_handler = CommandExecuteHandler(self)
+        self.handlers['execute'] = self._execute_handler
+        # Set by start() so stop() can skip the lookups when nothing was added
+        self._started = False
+        self._cmdDef = None
+        self._button = None
+        self.__panel = None
+        # (inputs, bodies, body states) from the last execute, to skip rebuilding identical boards
+        self._last_commit = None
+    
+    @property
+    def _panel(self):
+        """The Solid > Create toolbar panel, looked up on first use."""
+        if self.__panel is None:
+            self.__panel = self.ui.allToolbarPanels.itemById('SolidCreatePanel')
+        return self.__panel
     
     def create_command_definition(self):
-        print("Creating command definition...")
-        scriptDir = os.path.dirname(os.path.realpath(__file__))
-        iconPath = os.path.join(scriptDir, 'resources')
-        print(f"Checking icon path: {iconPath}")
-        if not os.path.exists(iconPath):
-            raise Exception(f"Resource folder not found at: {iconPath}")
+        log.debug("Creating command definition...")
+        if LumberSelector._cached_icon_path is None:
+            log.debug("Checking icon path: %s", _ICON_PATH)
+            if not os.path.exists(_ICON_PATH):
+                raise Exception(f"Resource folder not found at: {_ICON_PATH}")
+            LumberSelector._cached_icon_path = _ICON_PATH
+        iconPath = LumberSelector._cached_icon_path
     
         try:
             cmdDefs = self.ui.commandDefinitions
             cmdDef = cmdDefs.itemById('lumberDimensionSelector')
             if cmdDef:
-                print("Deleting existing command definition...")
+                log.debug("Deleting existing command definition...")
                 cmdDef.deleteMe()
     
             # IMPORTANT: The resource folder MUST contain valid icon files,
@@ -87,184 +127,180 @@ class LumberSelector:
                 'Open the lumber dialog',
                 iconPath  # Use the folder with valid icon images
             )
-            print("Command definition created successfully.")
+            log.debug("Command definition created successfully.")
             return cmdDef
         except Exception:
             self.ui.messageBox('Error in create_command_definition:\n{}'.format(traceback.format_exc()))
     
     def add_command_inputs(self, command):
-        print("Adding command inputs...")
+        log.debug("Adding command inputs...")
         inputs = command.commandInputs
         
         # Add a radio button group for dimension type.
         dimInput = inputs.addRadioButtonGroupCommandInput('dimensionType', 'Dimension Type', '')
-        dimInput.listItems.add('Nominal', True)
-        dimInput.listItems.add('Actual', False)
+        addDimItem = dimInput.listItems.add
+        addDimItem('Nominal', True)
+        addDimItem('Actual', False)
         
         # Add a radio button group for lumber size.
         sizeInput = inputs.addRadioButtonGroupCommandInput('lumberSize', 'Lumber Size', '')
-        for s in ['2x4', '2x6', '2x8', '2x10', '2x12']:
-            sizeInput.listItems.add(s, s == '2x4')
+        addSizeItem = sizeInput.listItems.add
+        for label, isDefault in _LUMBER_SIZE_ITEMS:
+            addSizeItem(label, isDefault)
         
         # Add a value input for length.
-        inputs.addValueInput('length', 'Length (feet)', 'ft', adsk.core.ValueInput.createByReal(96))
-        
-        # Add a selection input for an axis.
-        axisInput = inputs.addSelectionInput('axisSelection', 'Select Axis', 'Select an axis')
-        axisInput.addSelectionFilter('LinearEdges')
+        inputs.addValueInput('length', 'Length (feet)', 'ft', _DEFAULT_LENGTH)
         
-        # Add a selection input for a starting point.
-        pointInput = inputs.addSelectionInput('pointSelection', 'Starting Point', 'Select a starting point')
-        pointInput.setSelectionLimits(1)
-        pointInput.addSelectionFilter('SketchPoints')
-        pointInput.addSelectionFilter('Vertices')
-        print("Command inputs added successfully.")
+        # Add one selection input for the axes and the starting point. Each axis gets
+        # its own board; the picks are sorted by entity type on execute.
+        targetInput = inputs.addSelectionInput('target', 'Target', 'Pick axes and a starting point')
+        targetInput.selectionFilters = list(_TARGET_FILTERS)
+        targetInput.setSelectionLimits(2, 0)
+        log.debug("Command inputs added successfully.")
     
-    def command_created(self, args):
-        try:
-            eventArgs = adsk.core.CommandCreatedEventArgs.cast(args)
-            command = eventArgs.command
-            self.add_command_inputs(command)
+    def split_targets(self, targetInput):
+        """
+        Returns (axes, start) from the target selection: every picked edge is an axis and
+        the last picked point is the start. start is None if no point was picked.
+        """
+        axes = []
+        start = None
+        for i in range(targetInput.selectionCount):
+            entity = targetInput.selection(i).entity
+            if adsk.fusion.BRepEdge.cast(entity):
+                axes.append(entity)
+            else:
+                start = entity
+        return axes, start
     
-            onExecute = CommandExecuteHandler(self)
-            command.execute.add(onExecute)
-            self.handlers.append(onExecute)
-            print("Command creation complete.")
-        except Exception:
-            self.ui.messageBox('Error in command_created:\n{}'.format(traceback.format_exc()))
+    def placement_on_axis(self, rootComp, axis, start, planes):
+        """
+        Returns (plane, center) for a board centered on a linear edge, starting where the
+        start point projects onto the edge. The plane is normal to the edge at that spot
+        and center is the model-space point where the edge passes through it.
+        planes maps a plane's (normal, offset) to a construction plane already made in this
+        execute, so parallel edges whose boards start on the same plane share it.
+        """
+        sketchPoint = adsk.fusion.SketchPoint.cast(start)
+        startPoint = sketchPoint.worldGeometry if sketchPoint else start.geometry
     
-    def start(self):
-        print("Starting LumberSelector...")
-        try:
-            cmdDef = self.create_command_definition()
-            onCommandCreated = CommandCreatedEventHandler(self)
-            cmdDef.commandCreated.add(onCommandCreated)
-            self.handlers.append(onCommandCreated)
+        # Project the start point onto the edge as a 0..1 ratio along it
+        edgeStart = axis.startVertex.geometry
+        direction = edgeStart.vectorTo(axis.endVertex.geometry)
+        ratio = edgeStart.vectorTo(startPoint).dotProduct(direction) / (direction.length ** 2)
+        ratio = min(max(ratio, 0.0), 1.0)
     
-            panel = self.ui.allToolbarPanels.itemById('SolidCreatePanel')
-            panel.controls.addCommand(cmdDef)
-            print("LumberSelector started successfully.")
-        except Exception:
-            self.ui.messageBox('Error in start():\n{}'.format(traceback.format_exc()))
+        center = edgeStart.copy()
+        offset = direction.copy()
+        offset.scaleBy(ratio)
+        center.translateBy(offset)
     
-    def stop(self):
-        print("Stopping LumberSelector...")
-        try:
-            panel = self.ui.allToolbarPanels.itemById('SolidCreatePanel')
-            button = panel.controls.itemById('lumberDimensionSelector')
-            if button:
-                button.deleteMe()
+        # Key the plane on its unit normal (sign-normalized, since an edge can run either
+        # way) and its distance from the origin, rounded to absorb floating-point noise
+        normal = direction.copy()
+        normal.normalize()
+        n = (normal.x, normal.y, normal.z)
+        if next(c for c in n if abs(c) > 1e-9) < 0:
+            n = tuple(-c for c in n)
+        distance = n[0] * center.x + n[1] * center.y + n[2] * center.z
+        key = tuple(round(c, 6) for c in n) + (round(distance, 6),)
     
-            cmdDef = self.ui.commandDefinitions.itemById('lumberDimensionSelector')
-            if cmdDef:
-                cmdDef.deleteMe()
-            print("LumberSelector stopped.")
-        except Exception:
-            self.ui.messageBox('Error in stop():\n{}'.format(traceback.format_exc()))
-
-class CommandCreatedEventHandler(adsk.core.CommandCreatedEventHandler):
-    def __init__(self, lumberSelector):
-        super().__init__()
-        self.lumberSelector = lumberSelector
+        plane = planes.get(key)
+        if plane is None:
+            planeInput = rootComp.constructionPlanes.createInput()
+            planeInput.setByDistanceOnPath(axis, adsk.core.ValueInput.createByReal(ratio))
+            plane = planes[key] = rootComp.constructionPlanes.add(planeInput)
+        return plane, center
     
-    def notify(self, args):
-        print("Command created event triggered.")
-        self.lumberSelector.command_created(args)
-
-class CommandExecuteHandler(adsk.core.CommandEventHandler):
-    def __init__(self, lumberSelector):
-        super().__init__()
-        self.lumberSelector = lumberSelector
+    def draw_lumber(self, rootComp, placements):
+        """
+        Extrudes one board per placement, given as (plane, center, thickness, width, length) in cm.
+        Placements that share a plane and length are drawn as plain rectangles on one sketch
+        and extruded together, so a whole group costs one sketch solve and one feature.
+        Returns the new bodies.
+        """
+        sketches = rootComp.sketches
+        extrudes = rootComp.features.extrudeFeatures
     
-    def notify(self, args):
-        print("Command execution started.")
-        try:
-            eventArgs = adsk.core.CommandEventArgs.cast(args)
-            inputs = eventArgs.command.commandInputs
-            dimensionType = inputs.itemById('dimensionType').selectedItem.name
-            lumberSize = inputs.itemById('lumberSize').selectedItem.name
-            lengthValue = inputs.itemById('length').value
-            
-            msg = f"Selected: {dimensionType} {lumberSize} at {lengthValue} ft"
-            print(msg)
-            self.lumberSelector.ui.messageBox(msg)
-        except Exception:
-            self.lumberSelector.ui.messageBox('Error in command execution:\n{}'.format(traceback.format_exc()))
-
-def run(context):
-    print("Running LumberSelector add-in...")
-    try:
-        global lumber_selector
-        lumber_selector = LumberSelector()
-        lumber_selector.start()
-        print("LumberSelector is now running.")
-    except Exception:
-        adsk.core.Application.get().userInterface.messageBox('Error in run():\n{}'.format(traceback.format_exc()))
-
-def stop(context):
-    print("Stopping LumberSelector add-in...")
-    try:
-        global lumber_selector
-        lumber_selector.stop()
-        print("LumberSelector stopped.")
-    except Exception:
-        adsk.core.Application.get().userInterface.messageBox('Error in stop():\n{}'.format(traceback.format_exc()))
-
-        # Value input for Length
-        inputs.addValueInput('length', 'Length (feet)', 'ft', adsk.core.ValueInput.createByReal(96))
-        
-        # Selection input for Axis (for example purposes)
-        axisInput = inputs.addSelectionInput('axisSelection', 'Select Axis', 'Select an axis')
-        axisInput.addSelectionFilter('LinearEdges')
-        
-        # Selection input for Starting Point
-        pointInput = inputs.addSelectionInput('pointSelection', 'Starting Point', 'Select a starting point')
-        pointInput.setSelectionLimits(1)
-        pointInput.addSelectionFilter('SketchPoints')
-        pointInput.addSelectionFilter('Vertices')
-        print("Command inputs added successfully.")
+        groups = {}
+        for plane, center, thickness, width, length in placements:
+            groups.setdefault((plane, length), []).append((center, thickness, width))
+    
+        bodies = []
+        for (plane, length), boards in groups.items():
+            sketch = sketches.add(plane)
+            sketch.isComputeDeferred = True
+            addRectangle = sketch.sketchCurves.sketchLines.addTwoPointRectangle
+            for center, thickness, width in boards:
+                c = sketch.modelToSketchSpace(center)
+                addRectangle(
+                    adsk.core.Point3D.create(c.x - thickness / 2, c.y - width / 2, 0),
+                    adsk.core.Point3D.create(c.x + thickness / 2, c.y + width / 2, 0)
+                )
+            sketch.isComputeDeferred = False
+    
+            profiles = adsk.core.ObjectCollection.create()
+            for profile in sketch.profiles:
+                profiles.add(profile)
     
-    def command_created(self, args):
+            extrude = extrudes.addSimple(
+                profiles,
+                adsk.core.ValueInput.createByReal(length),
+                adsk.fusion.FeatureOperations.NewBodyFeatureOperation
+            )
+            bodies.extend(extrude.bodies)
+        return bodies
+    
+    def command_created(self, command):
         try:
-            eventArgs = adsk.core.CommandCreatedEventArgs.cast(args)
-            command = eventArgs.command
             self.add_command_inputs(command)
     
-            onExecute = CommandExecuteHandler(self)
-            command.execute.add(onExecute)
-            self.handlers.append(onExecute)
-            print("Command creation complete.")
+            command.execute.add(self._execute_handler)
+            log.debug("Command creation complete.")
         except Exception:
             self.ui.messageBox('Error in command_created:\n{}'.format(traceback.format_exc()))
     
     def start(self):
-        print("Starting LumberSelector...")
+        log.debug("Starting LumberSelector...")
         try:
             cmdDef = self.create_command_definition()
             onCommandCreated = CommandCreatedEventHandler(self)
             cmdDef.commandCreated.add(onCommandCreated)
-            self.handlers.append(onCommandCreated)
+            self.handlers['commandCreated'] = onCommandCreated
     
-            panel = self.ui.allToolbarPanels.itemById('SolidCreatePanel')
-            panel.controls.addCommand(cmdDef)
-            print("LumberSelector started successfully.")
+            # A run without a matching stop() leaves its button behind; replace it so the
+            # panel never shows two buttons for the command
+            controls = self._panel.controls
+            staleButton = controls.itemById('lumberDimensionSelector')
+            if staleButton:
+                staleButton.deleteMe()
+            self._button = controls.addCommand(cmdDef)
+            self._cmdDef = cmdDef
+            self._started = True
+            log.debug("LumberSelector started successfully.")
         except Exception:
             self.ui.messageBox('Error in start():\n{}'.format(traceback.format_exc()))
     
     def stop(self):
-        print("Stopping LumberSelector...")
+        log.debug("Stopping LumberSelector...")
+        if not self._started:
+            return
         try:
-            panel = self.ui.allToolbarPanels.itemById('SolidCreatePanel')
-            button = panel.controls.itemById('lumberDimensionSelector')
-            if button:
-                button.deleteMe()
-    
-            cmdDef = self.ui.commandDefinitions.itemById('lumberDimensionSelector')
-            if cmdDef:
-                cmdDef.deleteMe()
-            print("LumberSelector stopped.")
+            if self._button.isValid:
+                self._button.deleteMe()
+            if self._cmdDef.isValid:
+                self._cmdDef.commandCreated.remove(self.handlers['commandCreated'])
+                self._cmdDef.deleteMe()
+            self._started = False
+            log.debug("LumberSelector stopped.")
         except Exception:
             self.ui.messageBox('Error in stop():\n{}'.format(traceback.format_exc()))
+        finally:
+            # Release the handlers and the Fusion objects this run held on to
+            self.handlers.clear()
+            self._button = None
+            self._cmdDef = None
+            self._last_commit = None
 
 # Event handler for command creation.
 class CommandCreatedEventHandler(adsk.core.CommandCreatedEventHandler):
@@ -273,8 +309,9 @@ class CommandCreatedEventHandler(adsk.core.CommandCreatedEventHandler):
         self.lumberSelector = lumberSelector
     
     def notify(self, args):
-        print("Command created event triggered.")
-        self.lumberSelector.command_created(args)
+        log.debug("Command created event triggered.")
+        eventArgs = adsk.core.CommandCreatedEventArgs.cast(args)
+        self.lumberSelector.command_created(eventArgs.command)
 
 # Event handler for command execution.
 class CommandExecuteHandler(adsk.core.CommandEventHandler):
@@ -283,36 +320,69 @@ class CommandExecuteHandler(adsk.core.CommandEventHandler):
         self.lumberSelector = lumberSelector
     
     def notify(self, args):
-        print("Command execution started.")
+        log.debug("Command execution started.")
+        lumberSelector = self.lumberSelector
         try:
             eventArgs = adsk.core.CommandEventArgs.cast(args)
             inputs = eventArgs.command.commandInputs
             # Get the user selections.
             dimensionType = inputs.itemById('dimensionType').selectedItem.name
             lumberSize = inputs.itemById('lumberSize').selectedItem.name
+            # Fusion reports the value in cm whatever unit the input displays
             lengthValue = inputs.itemById('length').value
+            axes, start = lumberSelector.split_targets(inputs.itemById('target'))
+            if not axes or start is None:
+                lumberSelector.ui.messageBox('Select at least one axis and a starting point.')
+                return
+            
+            # Re-submitting the same inputs while the boards they made still exist would
+            # only stack identical bodies on top of them
+            commit = (
+                dimensionType, lumberSize, lengthValue,
+                tuple(axis.entityToken for axis in axes), start.entityToken
+            )
+            lastCommit = lumberSelector._last_commit
+            if lastCommit and lastCommit[0] == commit and lastCommit[2] == body_states(lastCommit[1]):
+                lumberSelector.ui.messageBox('These boards already exist. Change an input, or move, hide or delete the boards, to place them again.')
+                return
+            
+            # Collect every board first, then build them in as few sketches and extrudes as possible.
+            design = adsk.fusion.Design.cast(lumberSelector.app.activeProduct)
+            rootComp = design.rootComponent
+            thickness, width = LUMBER_DIMS[(dimensionType, lumberSize)]
+            
+            # Planes, sketches and extrudes from one execute collapse into a single timeline group
+            timelineStart = timeline_position(design)
+            try:
+                placements = []
+                planes = {}
+                for axis in axes:
+                    plane, center = lumberSelector.placement_on_axis(rootComp, axis, start, planes)
+                    placements.append((plane, center, thickness, width, lengthValue))
+                bodies = lumberSelector.draw_lumber(rootComp, placements)
+            finally:
+                group_timeline(design, timelineStart, f"{lumberSize} Lumber")
+            lumberSelector._last_commit = (commit, bodies, body_states(bodies))
             
-            msg = f"Selected: {dimensionType} {lumberSize} at {lengthValue} ft"
-            print(msg)
-            self.lumberSelector.ui.messageBox(msg)
+            log.debug("Placed %d %s %s board(s)", len(bodies), dimensionType, lumberSize)
         except Exception:
-            self.lumberSelector.ui.messageBox('Error in command execution:\n{}'.format(traceback.format_exc()))
+            lumberSelector.ui.messageBox('Error in command execution:\n{}'.format(traceback.format_exc()))
 
 def run(context):
-    print("Running LumberSelector add-in...")
+    log.debug("Running LumberSelector add-in...")
     try:
         global lumber_selector
         lumber_selector = LumberSelector()
         lumber_selector.start()
-        print("LumberSelector is now running.")
+        log.debug("LumberSelector is now running.")
     except Exception:
         adsk.core.Application.get().userInterface.messageBox('Error in run():\n{}'.format(traceback.format_exc()))
 
 def stop(context):
-    print("Stopping LumberSelector add-in...")
+    log.debug("Stopping LumberSelector add-in...")
     try:
         global lumber_selector
         lumber_selector.stop()
-        print("LumberSelector stopped.")
+        log.debug("LumberSelector stopped.")
     except Exception:
         adsk.core.Application.get().userInterface.messageBox('Error in stop():\n{}'.format(traceback.format_exc()))
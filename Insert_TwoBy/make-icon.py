@@ -46,19 +46,24 @@ def main():
         ("LargeIcon@2x.png", "64x64")
     ]
 
-    # Process each icon using ImageMagick.
-    for filename, size in icons:
+    # Generate every icon with one ImageMagick process so the input is decoded only once.
+    # Each size but the last resizes a clone of the original, writes it and drops the clone;
+    # the last one resizes the original itself.
+    # Using the "magick" command which is standard for recent ImageMagick installations.
+    cmd = ["magick", input_image]
+    for filename, size in icons[:-1]:
         output_path = os.path.join(dest_dir, filename)
-        # Build the ImageMagick command.
-        # Using the "magick" command which is standard for recent ImageMagick installations.
-        cmd = ["magick", "convert", input_image, "-resize", size, output_path]
-        print(f"Generating {filename} ({size}) ...")
-        try:
-            subprocess.run(cmd, check=True)
-        except subprocess.CalledProcessError as err:
-            print(f"Error: Failed to generate {filename}.")
-            print("Command:", " ".join(cmd))
-            sys.exit(1)
+        cmd += ["(", "+clone", "-resize", size, "-write", output_path, "+delete", ")"]
+    filename, size = icons[-1]
+    cmd += ["-resize", size, os.path.join(dest_dir, filename)]
+
+    print("Generating " + ", ".join(f"{filename} ({size})" for filename, size in icons) + " ...")
+    try:
+        subprocess.run(cmd, check=True)
+    except subprocess.CalledProcessError as err:
+        print("Error: Failed to generate the icon files.")
+        print("Command:", " ".join(cmd))
+        sys.exit(1)
 
     print(f"Icon files generated successfully in: {os.path.abspath(dest_dir)}")
 
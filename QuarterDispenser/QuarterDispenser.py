@@ -8,12 +8,55 @@ import adsk.core
 import adsk.fusion
 import traceback
 import math
+import hashlib
+import os
 
-app = adsk.core.Application.get()
-ui = app.userInterface
+# Show the build summary in a dialog; set to False to write it to the Text
+# Commands window instead, so unattended runs are not blocked waiting for OK
+SHOW_SUMMARY_DIALOG = True
+
+# Build the separate clear window panel; set to False to skip it when only the
+# opaque parts are wanted (e.g. exporting the body, button, gate and follower)
+CREATE_WINDOW_PANEL = True
+
+# Reuse a previously exported build when the dimensions and this script are
+# unchanged; the cached .f3d is imported instead of rebuilding every feature
+USE_BUILD_CACHE = False
+BUILD_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".fusion_cache")
+
+
+def build_cache_path(values):
+    """Return the cached .f3d path for these build inputs and the current script source."""
+    with open(os.path.abspath(__file__), 'rb') as f:
+        source = f.read()
+    key = hashlib.sha256(source + repr(values).encode()).hexdigest()[:12]
+    return os.path.join(BUILD_CACHE_DIR, f"quarter_{key}.f3d")
+
+
+def timeline_position(design):
+    """
+    Return the timeline marker position, or None for a direct-modeling design (it has no timeline).
+    """
+    if design.designType != adsk.fusion.DesignTypes.ParametricDesignType:
+        return None
+    return design.timeline.markerPosition
+
+
+def group_timeline(design, start_index, name):
+    """
+    Collapse the timeline entries added since start_index into one named group.
+    """
+    if start_index is None:
+        return
+
+    timeline = design.timeline
+    end_index = timeline.markerPosition - 1
+    if end_index > start_index:
+        timeline.timelineGroups.add(start_index, end_index).name = name
 
 
 def run(context):
+    ui = None
     try:
         app = adsk.core.Application.get()
         ui = app.userInterface
@@ -25,6 +68,9 @@ def run(context):
         root = design.rootComponent
         um = design.unitsManager
 
+        # Everything below is collapsed into one timeline group once it is built
+        timelineStart = timeline_position(design)
+
         # ==================== DIMENSIONS ====================
         # US Quarter dimensions
         QUARTER_DIA = 2.426  # cm (24.26mm)
@@ -49,6 +95,9 @@ def run(context):
         BUTTON_DEPTH = 0.3  # cm
         BUTTON_TRAVEL = 0.15  # cm
 
+        # Sliding gate thickness
+        GATE_THICK = 0.25  # cm
+
         # Fillet radius for smooth edges
         FILLET_RADIUS = 0.2  # cm (2mm)
 
@@ -60,52 +109,123 @@ def run(context):
         WINDOW_START = 0.8  # cm from front
         WINDOW_LENGTH = 2.0  # cm
 
+        # ==================== BUILD CACHE ====================
+
+        cachePath = None
+        if USE_BUILD_CACHE:
+            cachePath = build_cache_path((
+                QUARTER_DIA, QUARTER_THICK, QUARTER_COUNT, CLEARANCE, WALL_THICK, WINDOW_THICK,
+                BUTTON_WIDTH, BUTTON_HEIGHT, BUTTON_DEPTH, BUTTON_TRAVEL, GATE_THICK,
+                FILLET_RADIUS, SPRING_WIDTH, SPRING_HEIGHT, WINDOW_START, WINDOW_LENGTH,
+                CREATE_WINDOW_PANEL))
+            if os.path.exists(cachePath):
+                importManager = app.importManager
+                importManager.importToTarget(
+                    importManager.createFusionArchiveImportOptions(cachePath), root)
+                group_timeline(design, timelineStart, "Quarter Dispenser")
+                app.log(f"Quarter Dispenser imported from cache: {cachePath}")
+                return
+
+        # Local aliases for API members used throughout the build
+        createByReal = adsk.core.ValueInput.createByReal
+        createPoint = adsk.core.Point3D.create
+        NEW_BODY = adsk.fusion.FeatureOperations.NewBodyFeatureOperation
+        CUT = adsk.fusion.FeatureOperations.CutFeatureOperation
+        JOIN = adsk.fusion.FeatureOperations.JoinFeatureOperation
+
+        # One collection shared by every multi-item feature input; Fusion reads it
+        # when the feature is added, so it is cleared and refilled for the next one
+        sharedObjects = adsk.core.ObjectCollection.create()
+
+        # Every distance the features use, created once and shared by reference
+        VI = {
+            "body_len": createByReal(BODY_LENGTH),
+            "wall": createByReal(WALL_THICK),
+            "wall_gap": createByReal(WALL_THICK + 0.1),
+            "chamber_depth": createByReal(QUARTER_COUNT * QUARTER_THICK + CLEARANCE + 1.0),
+            "window_cut": createByReal(BODY_WIDTH + 1.0),
+            "window_offset": createByReal(WINDOW_START - (BODY_WIDTH + 1.0) / 2),
+            "recess_offset": createByReal(BODY_LENGTH * 0.7 - BUTTON_DEPTH),
+            "recess_depth": createByReal(BUTTON_DEPTH * 2),
+            "button_height": createByReal(BUTTON_DEPTH - 0.05),
+            "channel_depth": createByReal(0.3),
+            "gate_thick": createByReal(GATE_THICK),
+            "guide_offset": createByReal(WALL_THICK + 0.2),
+            "guide_len": createByReal(BODY_LENGTH - WALL_THICK * 2 - 1.0),
+            "follower_thick": createByReal(0.2),
+            "window_thick": createByReal(WINDOW_THICK),
+            "edge_fillet": createByReal(FILLET_RADIUS / 2),
+        }
+
+        # One-sided extents for every extrude, built from the shared distances
+        POSITIVE = adsk.fusion.ExtentDirections.PositiveExtentDirection
+        EXT = {key: adsk.fusion.DistanceExtentDefinition.create(VI[key])
+               for key in ("body_len", "chamber_depth", "window_cut", "wall_gap",
+                           "recess_depth", "button_height", "channel_depth", "gate_thick",
+                           "guide_len", "follower_thick", "window_thick")}
+
         # ==================== HELPER FUNCTIONS ====================
 
+        # Corner points reused by every rectangle; the sketch copies their coordinates
+        cornerPts = [createPoint(0, 0, 0) for _ in range(4)]
+
         def create_rounded_rect_sketch(sketch, width, height, x_offset=0, y_offset=0, fillet_r=0):
             """Create a rounded rectangle sketch"""
             lines = sketch.sketchCurves.sketchLines
 
-            # Create rectangle corners
-            p1 = adsk.core.Point3D.create(x_offset, y_offset, 0)
-            p2 = adsk.core.Point3D.create(x_offset + width, y_offset, 0)
-            p3 = adsk.core.Point3D.create(x_offset + width, y_offset + height, 0)
-            p4 = adsk.core.Point3D.create(x_offset, y_offset + height, 0)
-
-            # Draw lines
-            l1 = lines.addByTwoPoints(p1, p2)
-            l2 = lines.addByTwoPoints(p2, p3)
-            l3 = lines.addByTwoPoints(p3, p4)
-            l4 = lines.addByTwoPoints(p4, p1)
-
-            # Add fillets if requested
-            if fillet_r > 0:
-                try:
-                    sketch.sketchCurves.sketchArcs.addFillet(l1, l1.endSketchPoint.geometry,
-                                                             l2, l2.startSketchPoint.geometry, fillet_r)
-                    sketch.sketchCurves.sketchArcs.addFillet(l2, l2.endSketchPoint.geometry,
-                                                             l3, l3.startSketchPoint.geometry, fillet_r)
-                    sketch.sketchCurves.sketchArcs.addFillet(l3, l3.endSketchPoint.geometry,
-                                                             l4, l4.startSketchPoint.geometry, fillet_r)
-                    sketch.sketchCurves.sketchArcs.addFillet(l4, l4.endSketchPoint.geometry,
-                                                             l1, l1.startSketchPoint.geometry, fillet_r)
-                except:
-                    pass  # Fillets might fail for small dimensions
+            # Rectangle corners, counter-clockwise from the bottom-left
+            corners = [(x_offset, y_offset), (x_offset + width, y_offset),
+                       (x_offset + width, y_offset + height), (x_offset, y_offset + height)]
+            for pt, (x, y) in zip(cornerPts, corners):
+                pt.x, pt.y = x, y
+            edges = [lines.addByTwoPoints(cornerPts[i], cornerPts[(i + 1) % 4]) for i in range(4)]
+
+            # Skip the fillets when the radius would not fit on the shorter side
+            if fillet_r <= 0 or fillet_r >= min(width, height) * 0.49:
+                return
+
+            # Round each corner where one edge meets the next
+            arcs = sketch.sketchCurves.sketchArcs
+            for i in range(4):
+                first, second = edges[i], edges[(i + 1) % 4]
+                arcs.addFillet(first, first.endSketchPoint.geometry,
+                               second, second.startSketchPoint.geometry, fillet_r)
 
         def create_circle_sketch(sketch, center_x, center_y, radius):
             """Create a circle in a sketch"""
-            center = adsk.core.Point3D.create(center_x, center_y, 0)
+            center = createPoint(center_x, center_y, 0)
             return sketch.sketchCurves.sketchCircles.addByCenterRadius(center, radius)
 
+        def make_part(name, body_name, sketcher, extent):
+            """Create a sub-component of the dispenser, sketch it on its XY plane and extrude every profile"""
+            partComp = mainComp.occurrences.addNewComponent(adsk.core.Matrix3D.create()).component
+            partComp.name = name
+
+            partSketch = partComp.sketches.add(partComp.xYConstructionPlane)
+            sketcher(partSketch)
+
+            # Overlapping outlines split into several profiles; one extrude fuses them
+            sharedObjects.clear()
+            for i in range(partSketch.profiles.count):
+                sharedObjects.add(partSketch.profiles.item(i))
+            partExtrudes = partComp.features.extrudeFeatures
+            partExtInput = partExtrudes.createInput(sharedObjects, NEW_BODY)
+            partExtInput.setOneSideExtent(extent, POSITIVE)
+            partExtrudes.add(partExtInput).bodies.item(0).name = body_name
+            return partComp
+
         # ==================== CREATE MAIN BODY ====================
 
         # Create component for organization
         mainOcc = root.occurrences.addNewComponent(adsk.core.Matrix3D.create())
         mainComp = mainOcc.component
         mainComp.name = "Quarter Dispenser"
+        sketches = mainComp.sketches
+        xyPlane = mainComp.xYConstructionPlane
+        extrudes = mainComp.features.extrudeFeatures
 
         # Create the main body shell
-        bodySketch = mainComp.sketches.add(mainComp.xYConstructionPlane)
+        bodySketch = sketches.add(xyPlane)
         bodySketch.name = "Body Profile"
 
         # Create outer profile
@@ -114,17 +234,16 @@ def run(context):
 
         # Extrude the body
         bodyProfile = bodySketch.profiles.item(0)
-        extrudes = mainComp.features.extrudeFeatures
-        extInput = extrudes.createInput(bodyProfile, adsk.fusion.FeatureOperations.NewBodyFeatureOperation)
-        distance = adsk.core.ValueInput.createByReal(BODY_LENGTH)
-        extInput.setDistanceExtent(False, distance)
+        extInput = extrudes.createInput(bodyProfile, NEW_BODY)
+        distance = EXT["body_len"]
+        extInput.setOneSideExtent(distance, POSITIVE)
         bodyExtrude = extrudes.add(extInput)
         bodyExtrude.bodies.item(0).name = "Main Body"
 
         # ==================== CREATE QUARTER CHAMBER (HOLLOW OUT) ====================
 
         # Create sketch for quarter chamber
-        chamberSketch = mainComp.sketches.add(mainComp.xYConstructionPlane)
+        chamberSketch = sketches.add(xyPlane)
         chamberSketch.name = "Quarter Chamber"
 
         # Chamber is circular to match quarter shape
@@ -132,28 +251,21 @@ def run(context):
 
         # Extrude to hollow out
         chamberProfile = chamberSketch.profiles.item(0)
-        chamberExtInput = extrudes.createInput(chamberProfile, adsk.fusion.FeatureOperations.CutFeatureOperation)
+        chamberExtInput = extrudes.createInput(chamberProfile, CUT)
 
         # Chamber starts from the front and goes most of the way through
-        chamberOffset = adsk.core.ValueInput.createByReal(WALL_THICK)
-        chamberDepth = adsk.core.ValueInput.createByReal(QUARTER_COUNT * QUARTER_THICK + CLEARANCE + 1.0)
+        chamberOffset = VI["wall"]
+        chamberDepth = EXT["chamber_depth"]
         chamberExtInput.startExtent = adsk.fusion.FromEntityStartDefinition.create(
-            mainComp.xYConstructionPlane, chamberOffset)
-        chamberExtInput.setDistanceExtent(False, chamberDepth)
+            xyPlane, chamberOffset)
+        chamberExtInput.setOneSideExtent(chamberDepth, POSITIVE)
 
         chamberExtrude = extrudes.add(chamberExtInput)
 
         # ==================== CREATE VISIBILITY WINDOW ====================
 
-        # Create a plane offset for the window
-        planes = mainComp.constructionPlanes
-        planeInput = planes.createInput()
-        offsetVal = adsk.core.ValueInput.createByReal(WINDOW_START)
-        planeInput.setByOffset(mainComp.xYConstructionPlane, offsetVal)
-        windowPlane = planes.add(planeInput)
-
-        # Create window sketch
-        windowSketch = mainComp.sketches.add(windowPlane)
+        # Create window sketch (offsets come from the extrude start, not construction planes)
+        windowSketch = sketches.add(xyPlane)
         windowSketch.name = "Visibility Window"
 
         # Window is a rounded rectangle on the side
@@ -163,24 +275,21 @@ def run(context):
 
         # Cut through for the window - cut all the way through!
         windowProfile = windowSketch.profiles.item(0)
-        windowExtInput = extrudes.createInput(windowProfile, adsk.fusion.FeatureOperations.CutFeatureOperation)
+        windowExtInput = extrudes.createInput(windowProfile, CUT)
 
-        # Cut completely through both sides
-        windowCutDepth = adsk.core.ValueInput.createByReal(BODY_WIDTH + 1.0)
-        windowExtInput.setSymmetricExtent(windowCutDepth, True)
+        # Cut completely through both sides, centered on WINDOW_START
+        windowCutDepth = EXT["window_cut"]
+        windowOffset = VI["window_offset"]
+        windowExtInput.startExtent = adsk.fusion.FromEntityStartDefinition.create(
+            xyPlane, windowOffset)
+        windowExtInput.setOneSideExtent(windowCutDepth, POSITIVE)
 
         windowExtrude = extrudes.add(windowExtInput)
 
         # ==================== CREATE DISPENSER SLOT ====================
 
-        # Create sketch on front face for the dispenser slot
-        slotPlane = mainComp.constructionPlanes
-        slotPlaneInput = slotPlane.createInput()
-        slotOffset = adsk.core.ValueInput.createByReal(WALL_THICK)
-        slotPlaneInput.setByOffset(mainComp.xYConstructionPlane, slotOffset)
-        slotPlaneObj = slotPlane.add(slotPlaneInput)
-
-        slotSketch = mainComp.sketches.add(slotPlaneObj)
+        # Create sketch for the dispenser slot; the cut starts at the front wall
+        slotSketch = sketches.add(xyPlane)
         slotSketch.name = "Dispenser Slot"
 
         # Slot at the bottom for quarter to exit
@@ -193,21 +302,18 @@ def run(context):
 
         # Cut the slot
         slotProfile = slotSketch.profiles.item(0)
-        slotExtInput = extrudes.createInput(slotProfile, adsk.fusion.FeatureOperations.CutFeatureOperation)
-        slotDepth = adsk.core.ValueInput.createByReal(WALL_THICK + 0.1)
-        slotExtInput.setDistanceExtent(False, slotDepth)
+        slotExtInput = extrudes.createInput(slotProfile, CUT)
+        slotOffset = VI["wall"]
+        slotDepth = EXT["wall_gap"]
+        slotExtInput.startExtent = adsk.fusion.FromEntityStartDefinition.create(
+            xyPlane, slotOffset)
+        slotExtInput.setOneSideExtent(slotDepth, POSITIVE)
         slotExtrude = extrudes.add(slotExtInput)
 
         # ==================== CREATE BUTTON ====================
 
         # Create button on top surface
-        buttonPlane = mainComp.constructionPlanes
-        buttonPlaneInput = buttonPlane.createInput()
-        buttonOffset = adsk.core.ValueInput.createByReal(BODY_LENGTH * 0.7)
-        buttonPlaneInput.setByOffset(mainComp.xYConstructionPlane, buttonOffset)
-        buttonPlaneObj = buttonPlane.add(buttonPlaneInput)
-
-        buttonSketch = mainComp.sketches.add(buttonPlaneObj)
+        buttonSketch = sketches.add(xyPlane)
         buttonSketch.name = "Button"
 
         # Button positioned on top
@@ -220,32 +326,25 @@ def run(context):
         # Create button recess (where button sits)
         buttonRecessProfile = buttonSketch.profiles.item(0)
         buttonRecessInput = extrudes.createInput(buttonRecessProfile,
-                                                 adsk.fusion.FeatureOperations.CutFeatureOperation)
-        recessDepth = adsk.core.ValueInput.createByReal(BUTTON_DEPTH)
-        buttonRecessInput.setDistanceExtent(True, recessDepth)  # Cut inward (negative direction)
+                                                 CUT)
+        # Cut BUTTON_DEPTH to either side of 70% of the body length
+        recessOffset = VI["recess_offset"]
+        recessDepth = EXT["recess_depth"]
+        buttonRecessInput.startExtent = adsk.fusion.FromEntityStartDefinition.create(
+            xyPlane, recessOffset)
+        buttonRecessInput.setOneSideExtent(recessDepth, POSITIVE)
         buttonRecess = extrudes.add(buttonRecessInput)
 
         # Create actual button body (as separate component for different color)
-        buttonComp = mainComp.occurrences.addNewComponent(adsk.core.Matrix3D.create())
-        buttonCompObj = buttonComp.component
-        buttonCompObj.name = "Button"
-
-        buttonBodySketch = buttonCompObj.sketches.add(buttonCompObj.xYConstructionPlane)
-        create_rounded_rect_sketch(buttonBodySketch, BUTTON_WIDTH - 0.04, BUTTON_HEIGHT - 0.04,
-                                   -BUTTON_WIDTH/2 + 0.02, -BUTTON_HEIGHT/2 + 0.02, 0.08)
-
-        # Extrude button
-        buttonBodyProfile = buttonBodySketch.profiles.item(0)
-        buttonExtrudes = buttonCompObj.features.extrudeFeatures
-        buttonExtInput = buttonExtrudes.createInput(buttonBodyProfile,
-                                                    adsk.fusion.FeatureOperations.NewBodyFeatureOperation)
-        buttonHeight = adsk.core.ValueInput.createByReal(BUTTON_DEPTH - 0.05)
-        buttonExtInput.setDistanceExtent(False, buttonHeight)
-        buttonBodyExtrude = buttonExtrudes.add(buttonExtInput)
-        buttonBodyExtrude.bodies.item(0).name = "Button Body"
+        buttonCompObj = make_part(
+            "Button", "Button Body",
+            lambda sketch: create_rounded_rect_sketch(
+                sketch, BUTTON_WIDTH - 0.04, BUTTON_HEIGHT - 0.04,
+                -BUTTON_WIDTH/2 + 0.02, -BUTTON_HEIGHT/2 + 0.02, 0.08),
+            EXT["button_height"])
 
         # Position button in the recess
-        buttonComp.component.opacity = 1.0
+        buttonCompObj.opacity = 1.0
 
         # ==================== CREATE GATE MECHANISM ====================
 
@@ -253,13 +352,7 @@ def run(context):
         # Button pushes on the gate to release one quarter at a time
 
         # Gate channel - a slot for the gate to slide in
-        gateChannelPlane = mainComp.constructionPlanes
-        gateChannelPlaneInput = gateChannelPlane.createInput()
-        gateChannelOffset = adsk.core.ValueInput.createByReal(WALL_THICK + 0.1)
-        gateChannelPlaneInput.setByOffset(mainComp.xYConstructionPlane, gateChannelOffset)
-        gateChannelPlaneObj = gateChannelPlane.add(gateChannelPlaneInput)
-
-        gateChannelSketch = mainComp.sketches.add(gateChannelPlaneObj)
+        gateChannelSketch = sketches.add(xyPlane)
         gateChannelSketch.name = "Gate Channel"
 
         # Channel runs vertically along the front, next to the chamber
@@ -273,55 +366,36 @@ def run(context):
         # Cut the channel
         gateChannelProfile = gateChannelSketch.profiles.item(0)
         gateChannelExtInput = extrudes.createInput(gateChannelProfile,
-                                                   adsk.fusion.FeatureOperations.CutFeatureOperation)
-        channelDepth = adsk.core.ValueInput.createByReal(0.3)
-        gateChannelExtInput.setDistanceExtent(False, channelDepth)
+                                                   CUT)
+        gateChannelOffset = VI["wall_gap"]
+        channelDepth = EXT["channel_depth"]
+        gateChannelExtInput.startExtent = adsk.fusion.FromEntityStartDefinition.create(
+            xyPlane, gateChannelOffset)
+        gateChannelExtInput.setOneSideExtent(channelDepth, POSITIVE)
         gateChannelExtrude = extrudes.add(gateChannelExtInput)
 
-        # Create the gate component (slides up/down when button pressed)
-        gateComp = mainComp.occurrences.addNewComponent(adsk.core.Matrix3D.create())
-        gateCompObj = gateComp.component
-        gateCompObj.name = "Dispenser Gate"
-
-        gateSketch = gateCompObj.sketches.add(gateCompObj.xYConstructionPlane)
-
         # Gate is a small slider
         gate_width = gate_channel_width - 0.04  # clearance
         gate_height = 1.0  # tall enough to block quarters
-        gate_thickness = 0.25
-
-        create_rounded_rect_sketch(gateSketch, gate_width, gate_height,
-                                   -gate_width/2, -gate_height/2, 0.03)
-
-        # Extrude gate
-        gateProfile = gateSketch.profiles.item(0)
-        gateExtrudes = gateCompObj.features.extrudeFeatures
-        gateExtInput = gateExtrudes.createInput(gateProfile,
-                                                adsk.fusion.FeatureOperations.NewBodyFeatureOperation)
-        gateThick = adsk.core.ValueInput.createByReal(gate_thickness)
-        gateExtInput.setDistanceExtent(False, gateThick)
-        gateExtrude = gateExtrudes.add(gateExtInput)
-        gateExtrude.bodies.item(0).name = "Gate"
-
-        # Add a button pusher extension to the gate (top part that button presses)
-        pusherSketch = gateCompObj.sketches.add(gateCompObj.xYConstructionPlane)
+
+        # Button pusher extension (top part that button presses)
         pusher_width = 0.4
         pusher_height = 0.3
 
-        create_rounded_rect_sketch(pusherSketch, pusher_width, pusher_height,
-                                   -pusher_width/2, gate_height/2 - pusher_height/2, 0.05)
+        def sketch_gate(sketch):
+            create_rounded_rect_sketch(sketch, gate_width, gate_height,
+                                       -gate_width/2, -gate_height/2, 0.03)
+            create_rounded_rect_sketch(sketch, pusher_width, pusher_height,
+                                       -pusher_width/2, gate_height/2 - pusher_height/2, 0.05)
 
-        pusherProfile = pusherSketch.profiles.item(0)
-        pusherExtInput = gateExtrudes.createInput(pusherProfile,
-                                                  adsk.fusion.FeatureOperations.JoinFeatureOperation)
-        pusherThick = adsk.core.ValueInput.createByReal(gate_thickness)
-        pusherExtInput.setDistanceExtent(False, pusherThick)
-        pusherExtrude = gateExtrudes.add(pusherExtInput)
+        # Create the gate component (slides up/down when button pressed); the gate
+        # and pusher share one sketch and one extrude
+        make_part("Dispenser Gate", "Gate", sketch_gate, EXT["gate_thick"])
 
         # ==================== CREATE SPRING GUIDE ====================
 
         # Create internal rails/guides for quarter alignment
-        guideSketch = mainComp.sketches.add(mainComp.xYConstructionPlane)
+        guideSketch = sketches.add(xyPlane)
         guideSketch.name = "Spring Guide"
 
         # Create small guide rails on sides
@@ -337,99 +411,96 @@ def run(context):
         create_rounded_rect_sketch(guideSketch, guide_width, guide_height,
                                    guide_offset - guide_width/2, -guide_height/2, 0.02)
 
-        # Extrude guides
+        # Extrude both guides in one feature
+        sharedObjects.clear()
         for i in range(guideSketch.profiles.count):
-            guideProfile = guideSketch.profiles.item(i)
-            guideExtInput = extrudes.createInput(guideProfile,
-                                                 adsk.fusion.FeatureOperations.JoinFeatureOperation)
-            guideStartOffset = adsk.core.ValueInput.createByReal(WALL_THICK + 0.2)
-            guideLength = adsk.core.ValueInput.createByReal(BODY_LENGTH - WALL_THICK * 2 - 1.0)
-            guideExtInput.startExtent = adsk.fusion.FromEntityStartDefinition.create(
-                mainComp.xYConstructionPlane, guideStartOffset)
-            guideExtInput.setDistanceExtent(False, guideLength)
-            guideExtrude = extrudes.add(guideExtInput)
+            sharedObjects.add(guideSketch.profiles.item(i))
+        guideExtInput = extrudes.createInput(sharedObjects,
+                                             JOIN)
+        guideStartOffset = VI["guide_offset"]
+        guideLength = EXT["guide_len"]
+        guideExtInput.startExtent = adsk.fusion.FromEntityStartDefinition.create(
+            xyPlane, guideStartOffset)
+        guideExtInput.setOneSideExtent(guideLength, POSITIVE)
+        guideExtrude = extrudes.add(guideExtInput)
 
         # ==================== CREATE SPRING FOLLOWER ====================
 
-        # Create a separate component for the spring follower
-        followerComp = mainComp.occurrences.addNewComponent(adsk.core.Matrix3D.create())
-        followerCompObj = followerComp.component
-        followerCompObj.name = "Spring Follower"
-
-        followerSketch = followerCompObj.sketches.add(followerCompObj.xYConstructionPlane)
-
-        # Follower is a disc that fits in the chamber
+        # Create a separate component for the spring follower; the follower is a
+        # disc that fits in the chamber
         follower_radius = QUARTER_DIA/2 + CLEARANCE - 0.02
-        create_circle_sketch(followerSketch, 0, 0, follower_radius)
-
-        # Extrude follower
-        followerProfile = followerSketch.profiles.item(0)
-        followerExtrudes = followerCompObj.features.extrudeFeatures
-        followerExtInput = followerExtrudes.createInput(followerProfile,
-                                                        adsk.fusion.FeatureOperations.NewBodyFeatureOperation)
-        followerThick = adsk.core.ValueInput.createByReal(0.2)
-        followerExtInput.setDistanceExtent(False, followerThick)
-        followerExtrude = followerExtrudes.add(followerExtInput)
-        followerExtrude.bodies.item(0).name = "Follower Disc"
+        make_part("Spring Follower", "Follower Disc",
+                  lambda sketch: create_circle_sketch(sketch, 0, 0, follower_radius),
+                  EXT["follower_thick"])
 
         # ==================== CREATE TRANSPARENT WINDOW PANEL ====================
 
-        # Create a separate component for the transparent window
-        windowPanelComp = mainComp.occurrences.addNewComponent(adsk.core.Matrix3D.create())
-        windowPanelCompObj = windowPanelComp.component
-        windowPanelCompObj.name = "Transparent Window"
-
-        windowPanelSketch = windowPanelCompObj.sketches.add(windowPanelCompObj.xYConstructionPlane)
-
-        # Window panel dimensions (slightly smaller than the cutout)
-        panel_width = WINDOW_LENGTH - 0.02
-        panel_height = window_height - 0.02
+        if CREATE_WINDOW_PANEL:
+            # Window panel dimensions (slightly smaller than the cutout)
+            panel_width = WINDOW_LENGTH - 0.02
+            panel_height = window_height - 0.02
 
-        create_rounded_rect_sketch(windowPanelSketch, panel_width, panel_height,
-                                   -panel_width/2, -panel_height/2, 0.08)
+            # Create a separate component for the transparent window
+            windowPanelCompObj = make_part(
+                "Transparent Window", "Window Panel",
+                lambda sketch: create_rounded_rect_sketch(
+                    sketch, panel_width, panel_height, -panel_width/2, -panel_height/2, 0.08),
+                EXT["window_thick"])
 
-        # Extrude window panel
-        windowPanelProfile = windowPanelSketch.profiles.item(0)
-        windowPanelExtrudes = windowPanelCompObj.features.extrudeFeatures
-        windowPanelExtInput = windowPanelExtrudes.createInput(windowPanelProfile,
-                                                              adsk.fusion.FeatureOperations.NewBodyFeatureOperation)
-        windowPanelThick = adsk.core.ValueInput.createByReal(WINDOW_THICK)
-        windowPanelExtInput.setDistanceExtent(False, windowPanelThick)
-        windowPanelExtrude = windowPanelExtrudes.add(windowPanelExtInput)
-        windowPanelExtrude.bodies.item(0).name = "Window Panel"
-
-        # Make window semi-transparent in display
-        windowPanelCompObj.opacity = 0.3
+            # Make window semi-transparent in display
+            windowPanelCompObj.opacity = 0.3
 
         # ==================== APPLY FILLETS FOR COMFORT ====================
 
         # Apply fillets to all sharp external edges
+        filletsFailed = False
         try:
             fillets = mainComp.features.filletFeatures
-            edgeCollection = adsk.core.ObjectCollection.create()
+            sharedObjects.clear()
 
-            # Collect external edges
+            # Collect only the outer perimeter edges of the two end caps; the
+            # chamber, slot and window edges left by the cuts are skipped
             body = bodyExtrude.bodies.item(0)
-            for edge in body.edges:
-                # Add all external edges
-                if edge.isDegenerate == False:
-                    edgeCollection.add(edge)
-
-            if edgeCollection.count > 0:
+            for face in body.faces:
+                plane = adsk.core.Plane.cast(face.geometry)
+                if not plane or abs(abs(plane.normal.z) - 1) > 1e-6:
+                    continue
+                faceZ = face.pointOnFace.z
+                if abs(faceZ) > 1e-4 and abs(faceZ - BODY_LENGTH) > 1e-4:
+                    continue
+                for loop in face.loops:
+                    if loop.isOuter:
+                        for edge in loop.edges:
+                            sharedObjects.add(edge)
+
+            if sharedObjects.count > 0:
                 filletInput = fillets.createInput()
-                filletInput.addConstantRadiusEdgeSet(edgeCollection,
-                                                     adsk.core.ValueInput.createByReal(FILLET_RADIUS/2),
+                filletInput.addConstantRadiusEdgeSet(sharedObjects,
+                                                     VI["edge_fillet"],
                                                      False)
                 filletInput.isG2 = False
                 filletInput.isRollingBallCorner = True
                 fillets.add(filletInput)
         except:
             # Fillets might fail on some edges, that's okay
-            pass
+            filletsFailed = True
+
+        group_timeline(design, timelineStart, "Quarter Dispenser")
+
+        # Save the finished component so an unchanged rerun can import it. A build whose
+        # fillets failed is not cached, and a failed export leaves the built model alone.
+        if cachePath and not filletsFailed:
+            try:
+                os.makedirs(BUILD_CACHE_DIR, exist_ok=True)
+                exportManager = design.exportManager
+                exportManager.execute(
+                    exportManager.createFusionArchiveExportOptions(cachePath, mainComp))
+            except:
+                app.log(f"Warning: could not cache the build to {cachePath}:\n{traceback.format_exc()}")
 
         # ==================== SUMMARY MESSAGE ====================
 
-        ui.messageBox(
+        summary = (
             "Quarter Dispenser created successfully!\n\n"
             f"Design specifications:\n"
             f"- Holds {QUARTER_COUNT} US quarters\n"
@@ -459,6 +530,10 @@ def run(context):
             "- Assign different colors to each component in your slicer\n"
             "- Recommended: Main body in solid color, window in clear filament"
         )
+        if SHOW_SUMMARY_DIALOG:
+            ui.messageBox(summary)
+        else:
+            app.log(summary)
 
     except:
         if ui:
@@ -1,40 +1,29 @@
 import adsk.core, adsk.fusion, adsk.cam, traceback
-import os.path
+import logging
 
-for _ in range(50):  # Adjust the range as needed to "clear" the visible portion
-    print("\n")
+# Fusion loads the script folder as a package, so the sibling modules are imported
+# relative to it and can't collide with other scripts' or add-ins' modules.
+from . import framed_plywood
+from . import utils
 
-print(f"Da Start")
-# Construct the absolute path to the FramedPlywood module.
-script_dir = os.path.dirname(os.path.abspath(__file__))
-print(f"[DEBUG] Script directory: {script_dir}")
-
-framed_plywood_module_path = os.path.join(script_dir, "framed_plywood.py")
-print(f"[DEBUG] FramedPlywood module path: {framed_plywood_module_path}")
-
-# Import FramedPlywood module using its absolute path.
-import importlib.util
-framed_plywood_spec = importlib.util.spec_from_file_location("framed_plywood", framed_plywood_module_path)
-framed_plywood = importlib.util.module_from_spec(framed_plywood_spec)
-framed_plywood_spec.loader.exec_module(framed_plywood)
-print("[DEBUG] FramedPlywood module imported successfully.")
+log = logging.getLogger(__name__)
+log.debug("FramedPlywood module imported successfully.")
 
 def run(context):
-    print("[DEBUG] Entered run(context).")
+    log.debug("Entered run(context).")
     ui = None
     try:
         # Get the application and user interface objects
-        app = adsk.core.Application.get()
+        app = utils.get_app()
         ui = app.userInterface
-        print("[DEBUG] Application and UI initialized.")
+        log.debug("Application and UI initialized.")
 
         # Call the function to create the framed plywood assembly
-        print("[DEBUG] Calling framed_plywood.create_framed_plywood().")
+        log.debug("Calling framed_plywood.create_framed_plywood().")
         framed_plywood.create_framed_plywood()
-        print("[DEBUG] framed_plywood.create_framed_plywood() completed.")
+        log.debug("framed_plywood.create_framed_plywood() completed.")
 
     except Exception as e:
-        print("[DEBUG] Exception occurred in run(context):")
-        print(traceback.format_exc())
+        log.exception("Exception occurred in run(context)")
         if ui:
             ui.messageBox(f"Failed:\n{traceback.format_exc()}")
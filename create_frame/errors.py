@@ -0,0 +1,3 @@
+class FrameBuildError(RuntimeError):
+    """Raised when a plywood or frame board feature cannot be created."""
+    pass
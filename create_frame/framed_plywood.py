@@ -1,26 +1,15 @@
 import adsk.core, adsk.fusion, adsk.cam, traceback
-import os.path
 
-# Get the absolute path of the directory where the script is located.
-script_dir = os.path.dirname(os.path.abspath(__file__))
-
-# Construct the absolute paths to the module files.
-plywood_module_path = os.path.join(script_dir, "plywood.py")
-framing_board_module_path = os.path.join(script_dir, "framing_board.py")
-
-# Import the modules using their absolute paths.
-import importlib.util
-plywood_spec = importlib.util.spec_from_file_location("plywood", plywood_module_path)
-plywood = importlib.util.module_from_spec(plywood_spec)
-plywood_spec.loader.exec_module(plywood)
-
-framing_board_spec = importlib.util.spec_from_file_location("framing_board", framing_board_module_path)
-framing_board = importlib.util.module_from_spec(framing_board_spec)
-framing_board_spec.loader.exec_module(framing_board)
+from . import plywood
+from . import framing_board
+from . import utils
+from .errors import FrameBuildError
 
 def create_framed_plywood():
+    """Builds the plywood panel and its frame in the active design."""
+    ui = None
     try:
-        app = adsk.core.Application.get()
+        app = utils.get_app()
         ui = app.userInterface
         design = app.activeProduct
 
@@ -41,22 +30,26 @@ def create_framed_plywood():
 
         inset_depth = 0.25  # inches (how deep the plywood sits in the frame)
 
+        # Everything built below is collapsed into one timeline group
+        timeline_start = utils.timeline_position(design)
+
         # --- Create the plywood ---
         plywood_body = plywood.create_plywood(rootComp, plywood_width, plywood_length, plywood_thickness)
 
         # --- Create the frame boards ---
         # Find the right face of the plywood for the frame
         max_x_face = None
+        max_x = float("-inf")
         for face in plywood_body.faces:
             face_x_value = face.boundingBox.maxPoint.x
-            if max_x_face is None or face_x_value > max_x_face.boundingBox.maxPoint.x:
-                max_x_face = face
+            if face_x_value > max_x:
+                max_x, max_x_face = face_x_value, face
 # Dimensions for this particular side of the frame
         # board_length   = plywood_length   # how long we want the board in the local X direction
         # board_width    = frame_width      # how wide we want the board in local Y
         # board_thickness = frame_thickness
 
-        # frame_board_body = framing_board.create_frame_board(
+        # frame_board_ext = framing_board.create_frame_board(
         #     rootComp,
         #     max_x_face,        # the planar face you want to sketch on
         #     board_length,      # length in local X of the face
@@ -66,19 +59,20 @@ def create_framed_plywood():
         # )
 
 
-        # if frame_board_body is None:
-        #     ui.messageBox("Frame board body is None. Extrude likely failed.")
-        #     return
-
         # --- Move the Frame forward by inset depth ---
         # transform = adsk.core.Matrix3D.create()
         # transform.translation = adsk.core.Vector3D.create(0, 0, inset_depth)
 
         # moveFeats = rootComp.features.moveFeatures
         # moveFeatureInput = moveFeats.createInput(adsk.core.ObjectCollection.create(), transform)
-        # moveFeatureInput.bodies.add(frame_board_body)
+        # moveFeatureInput.bodies.add(frame_board_ext.bodies.item(0))
         # moveFeats.add(moveFeatureInput)
 
+        utils.group_timeline(design, timeline_start, "Framed Plywood")
+
+    except FrameBuildError as e:
+        if ui:
+            ui.messageBox('Failed to build the framed plywood:\n{}'.format(e))
     except:
         if ui:
             ui.messageBox('Failed:\n{}'.format(traceback.format_exc()))
\ No newline at end of file
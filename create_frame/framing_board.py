@@ -1,4 +1,9 @@
 import adsk.core, adsk.fusion
+from .errors import FrameBuildError
+
+_Point3D = adsk.core.Point3D.create
+_ValInput = adsk.core.ValueInput.createByReal
+_NewBody = adsk.fusion.FeatureOperations.NewBodyFeatureOperation
 
 def create_frame_board(rootComp, face, board_length, board_width, board_thickness, inset_depth):
     """
@@ -16,59 +21,59 @@ def create_frame_board(rootComp, face, board_length, board_width, board_thicknes
         inset_depth     : How much to “inset” or offset the board in the sketch plane, if needed.
 
     Returns:
-        The extruded board body, or None if creation failed.
-    """
-    app = adsk.core.Application.get()
-    ui  = app.userInterface
+        The extrude feature holding the board body, named "Frame Board".
 
+    Raises:
+        FrameBuildError: If the sketch has no profile matching the rectangle or the
+                         extrude fails.
+    """
     # --------------------------------------------------------------------------
     # 1) Create a new sketch on the specified face (2D plane).
     # --------------------------------------------------------------------------
     frame_sketch = rootComp.sketches.add(face)
 
     # --------------------------------------------------------------------------
-    # 2) Define a rectangle in *local plane* coordinates.
-    #    - (0, 0) is the origin in the sketch plane.
-    #    - If you want to offset/inset, just shift your corner points accordingly.
+    # 2) Define a rectangle in *local plane* coordinates, from
+    #    (inset_depth, inset_depth) to (board_length - inset_depth, board_width - inset_depth).
+    #    The sketch is solved once, after the rectangle is drawn.
     # --------------------------------------------------------------------------
-    # For example, let's position the rectangle from (inset_depth, inset_depth)
-    # to (board_length - inset_depth, board_width - inset_depth).
-    # You can adjust as needed.
-    p1_local = adsk.core.Point3D.create(inset_depth, inset_depth, 0)
-    p2_local = adsk.core.Point3D.create(
-        board_length - inset_depth,
-        board_width - inset_depth,
-        0
-    )
-
-    # Draw the rectangle
+    frame_sketch.isComputeDeferred = True
     lines = frame_sketch.sketchCurves.sketchLines
-    rect_lines = lines.addTwoPointRectangle(p1_local, p2_local)
+    rect = (inset_depth, inset_depth, board_length - inset_depth, board_width - inset_depth)
+    lines.addTwoPointRectangle(_Point3D(rect[0], rect[1], 0), _Point3D(rect[2], rect[3], 0))
+    frame_sketch.isComputeDeferred = False
 
     # Check we got a profile
-    if frame_sketch.profiles.count == 0:
-        ui.messageBox("No profiles found for the frame board rectangle.")
-        return None
+    profiles = frame_sketch.profiles
+    if profiles.count == 0:
+        raise FrameBuildError("No profiles found for the frame board rectangle.")
 
-    # We expect the rectangle to give us 1 profile:
-    frame_profile = frame_sketch.profiles.item(0)
+    # Pick the profile that spans the rectangle. Edges projected from the face can
+    # split or surround it, so the first profile is not necessarily the board.
+    frame_profile = None
+    for i in range(profiles.count):
+        box = profiles.item(i).boundingBox
+        extents = (box.minPoint.x, box.minPoint.y, box.maxPoint.x, box.maxPoint.y)
+        if all(abs(a - b) < 1e-6 for a, b in zip(extents, rect)):
+            frame_profile = profiles.item(i)
+            break
+    if frame_profile is None:
+        raise FrameBuildError(
+            "No profile matches the frame board rectangle; "
+            "other sketch geometry on the face overlaps the board.")
 
     # --------------------------------------------------------------------------
     # 3) Extrude the profile in the face normal direction by board_thickness.
     # --------------------------------------------------------------------------
     extrudes = rootComp.features.extrudeFeatures
-    thickness_input = adsk.core.ValueInput.createByReal(board_thickness)
-
     frame_ext = extrudes.addSimple(
         frame_profile,
-        thickness_input,
-        adsk.fusion.FeatureOperations.NewBodyFeatureOperation
+        _ValInput(board_thickness),
+        _NewBody
     )
 
     if not frame_ext or frame_ext.bodies.count == 0:
-        ui.messageBox("Extrude failed for frame board.")
-        return None
+        raise FrameBuildError("Extrude failed for frame board.")
 
-    board_body = frame_ext.bodies.item(0)
-    board_body.name = "Frame Board"
-    return board_body
+    frame_ext.bodies.item(0).name = "Frame Board"
+    return frame_ext
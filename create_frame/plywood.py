@@ -1,4 +1,12 @@
-import adsk.core, adsk.fusion
+import adsk.core, adsk.fusion, logging
+from . import utils
+from .errors import FrameBuildError
+
+log = logging.getLogger(__name__)
+
+_Point3D = adsk.core.Point3D.create
+_ValInput = adsk.core.ValueInput.createByReal
+_NewBody = adsk.fusion.FeatureOperations.NewBodyFeatureOperation
 
 def create_plywood(rootComp, width, length, thickness):
     """Creates the plywood component.
@@ -11,64 +19,60 @@ def create_plywood(rootComp, width, length, thickness):
 
     Returns:
         The plywood body.
+
+    Raises:
+        FrameBuildError: If the sketch has no profile or the extrude fails.
     """
-    app = adsk.core.Application.get()
-    ui = app.userInterface
-    
-    # Debug: Print the current distance display units in Fusion
-    unitsMgr = app.activeProduct.unitsManager
-    print(f"[DEBUG] Current Distance Units: {unitsMgr.distanceDisplayUnits}")
-    
-    # Debug: Print the parameters we're about to use
-    print(f"[DEBUG] create_plywood called with:")
-    print(f" - width: {width} in")
-    print(f" - length: {length} in")
-    print(f" - thickness: {thickness} in")
+    # The debug output below queries Fusion, so it only runs when debug logging is on
+    debug = log.isEnabledFor(logging.DEBUG)
+    if debug:
+        unitsMgr = utils.get_app().activeProduct.unitsManager
+        log.debug("Current Distance Units: %s", unitsMgr.distanceDisplayUnits)
+        log.debug("create_plywood called with: width=%s in, length=%s in, thickness=%s in",
+                  width, length, thickness)
 
     # Create a new sketch on the XZ plane.
     sketch = rootComp.sketches.add(rootComp.xZConstructionPlane)
 
-    # Create a rectangle for the plywood
+    # Create a rectangle for the plywood, holding off the sketch solve until it is complete
+    sketch.isComputeDeferred = True
     plywood_rect_lines = sketch.sketchCurves.sketchLines.addTwoPointRectangle(
-        adsk.core.Point3D.create(0, 0, 0),
-        adsk.core.Point3D.create(width, thickness, 0)
+        _Point3D(0, 0, 0),
+        _Point3D(width, thickness, 0)
     )
+    sketch.isComputeDeferred = False
 
-    # Debug: Print info about the rectangle lines
-    for i, line in enumerate(plywood_rect_lines):
-        line_length = line.length
-        print(f"[DEBUG] Rectangle line {i} length: {line_length:.4f} in")
+    if debug:
+        for i, line in enumerate(plywood_rect_lines):
+            log.debug("Rectangle line %d length: %.4f in", i, line.length)
 
     # Retrieve the profile formed by the rectangle
     if sketch.profiles.count == 0:
-        print("[DEBUG] No profiles found in the sketch!")
-        return None
+        raise FrameBuildError("No profiles found in the plywood sketch.")
 
     plywood_prof = sketch.profiles.item(0)
 
-    # Debug: Print the area of the profile
-    prof_area = plywood_prof.areaProperties().area
-    print(f"[DEBUG] Plywood profile area: {prof_area:.4f} square units")
+    if debug:
+        log.debug("Plywood profile area: %.4f square units", plywood_prof.areaProperties().area)
 
     # Extrude the plywood by `length` along the sketch's normal (Z direction for XZ plane)
     extrudes = rootComp.features.extrudeFeatures
     plywood_ext = extrudes.addSimple(
         plywood_prof,
-        adsk.core.ValueInput.createByReal(length),
-        adsk.fusion.FeatureOperations.NewBodyFeatureOperation
+        _ValInput(length),
+        _NewBody
     )
 
     if not plywood_ext or plywood_ext.bodies.count == 0:
-        print("[DEBUG] Plywood extrusion failed!")
-        return None
+        raise FrameBuildError("Plywood extrusion failed.")
 
     plywood_body = plywood_ext.bodies.item(0)
     plywood_body.name = "Plywood"
 
-    # Debug: Print the bounding box of the newly created body
-    bbox = plywood_body.boundingBox
-    print("[DEBUG] Plywood body bounding box:")
-    print(f" - minPoint = ({bbox.minPoint.x:.3f}, {bbox.minPoint.y:.3f}, {bbox.minPoint.z:.3f})")
-    print(f" - maxPoint = ({bbox.maxPoint.x:.3f}, {bbox.maxPoint.y:.3f}, {bbox.maxPoint.z:.3f})")
+    if debug:
+        bbox = plywood_body.boundingBox
+        log.debug("Plywood body bounding box: min=(%.3f, %.3f, %.3f) max=(%.3f, %.3f, %.3f)",
+                  bbox.minPoint.x, bbox.minPoint.y, bbox.minPoint.z,
+                  bbox.maxPoint.x, bbox.maxPoint.y, bbox.maxPoint.z)
 
     return plywood_body
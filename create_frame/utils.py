@@ -1,4 +1,29 @@
-# Add any utility functions here (if needed)
-# For example:
-# def inches_to_cm(inches):
-#     return inches * 2.54
\ No newline at end of file
+import adsk.core, adsk.fusion
+import functools
+
+@functools.lru_cache(maxsize=1)
+def get_app():
+    """
+    Resolve the Fusion application once and reuse it for later calls.
+    """
+    return adsk.core.Application.get()
+
+def timeline_position(design):
+    """
+    Return the timeline marker position, or None for a direct-modeling design (it has no timeline).
+    """
+    if design.designType != adsk.fusion.DesignTypes.ParametricDesignType:
+        return None
+    return design.timeline.markerPosition
+
+def group_timeline(design, start_index, name):
+    """
+    Collapse the timeline entries added since start_index into one named group.
+    """
+    if start_index is None:
+        return
+
+    timeline = design.timeline
+    end_index = timeline.markerPosition - 1
+    if end_index > start_index:
+        timeline.timelineGroups.add(start_index, end_index).name = name